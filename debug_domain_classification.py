@@ -27,7 +27,7 @@ def debug_domain_classification():
         print(f"\nQuery: '{query}'")
         
         # Load domain map for inspection
-        domain_map = legal_data_loader.domain_maps.get('IN', {})
+        domain_map = legal_data_loader.get_domain_map('IN') or {}
         keyword_mapping = domain_map.get('keyword_mapping', {})
         
         print("  Keyword mapping for each subdomain:")
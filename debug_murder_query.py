@@ -26,8 +26,8 @@ def debug_murder_query():
     print(f"2. Domain: {domain}, Subdomain: {subdomain}, Confidence: {confidence}")
     
     # Step 3: Check UAE domain map
-    if jurisdiction in legal_data_loader.domain_maps:
-        domain_map = legal_data_loader.domain_maps[jurisdiction]
+    domain_map = legal_data_loader.get_domain_map(jurisdiction)
+    if domain_map is not None:
         keyword_mapping = domain_map.get('keyword_mapping', {})
         
         print(f"3. UAE Keyword Mapping:")
@@ -38,8 +38,8 @@ def debug_murder_query():
                 print(f"   {subdomain_key}: {matches}")
     
     # Step 4: Check UAE law dataset
-    if jurisdiction in legal_data_loader.law_datasets:
-        dataset = legal_data_loader.law_datasets[jurisdiction]
+    dataset = legal_data_loader.get_law_dataset(jurisdiction)
+    if dataset is not None:
         print(f"4. UAE Dataset Keys: {list(dataset.keys())}")
         
         # Check if criminal law data exists
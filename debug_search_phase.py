@@ -24,7 +24,7 @@ def debug_search_phase():
     print(f"Domain: {domain}, Subdomain: {subdomain}, Confidence: {confidence}")
     
     # Manually call the search function for Indian law
-    dataset = legal_data_loader.law_datasets.get(jurisdiction, {})
+    dataset = legal_data_loader.get_law_dataset(jurisdiction) or {}
     print(f"Dataset keys: {list(dataset.keys())}")
     
     # Show IT Act data if it exists
@@ -7,27 +7,49 @@ import sys
 import os
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
 import traceback
 import uuid
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
 import threading
+import queue
 import time
 import hmac
 import hashlib
 import re
+import functools
+import asyncio
+from typing import Any, Optional
 
 # FastAPI integration for interactive docs
 try:
-    from fastapi import FastAPI, Request
+    from fastapi import FastAPI, HTTPException, Request
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse, Response
+    from pydantic import BaseModel, ValidationError
     import uvicorn
     FASTAPI_AVAILABLE = True
 except ImportError:
     FASTAPI_AVAILABLE = False
     print("FastAPI not available, using basic HTTP server")
 
+# msgspec for fast request body decoding on the FastAPI endpoints
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# orjson serializes responses straight to bytes when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import legal data loader
 try:
     from legal_data_loader import legal_data_loader
@@ -39,35 +61,95 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Request threads only enqueue log records; a single listener thread does the
+# actual stream writes so logging never blocks a handler on I/O
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+log_listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+root_logger.handlers = [QueueHandler(log_queue)]
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Response timestamps only need one-second resolution, so the formatted string
+# is cached and rebuilt at most once per second. The (second, iso) tuple is
+# swapped atomically, so no lock is needed between handler threads.
+_timestamp_cache = (0, "")
+
+def now_iso():
+    """Current UTC time as an ISO-8601 string, cached per second"""
+    global _timestamp_cache
+    second, iso = _timestamp_cache
+    now = int(time.time())
+    if now != second:
+        iso = datetime.utcfromtimestamp(now).isoformat()
+        _timestamp_cache = (now, iso)
+    return iso
+
+# Safety patterns are compiled once at import into a single alternation;
+# the named group that matched tells which class of violation was found.
+# Patterns are lowercase and are run against casefolded text.
+SAFETY_PATTERN_RE = re.compile(
+    r"(?P<dangerous>exec\(|eval\(|__import__|os\.system|subprocess|import os)"
+    r"|(?P<sql>drop\s+table|drop\s+database|;\s*drop|union\s+select|'or\s+1=1)"
+)
+# Same patterns for scanning raw ASCII request bodies without decoding them;
+# sre runs tighter loops over bytes than over str
+SAFETY_PATTERN_BYTES_RE = re.compile(SAFETY_PATTERN_RE.pattern.encode('ascii'))
+SAFETY_VIOLATION_MESSAGES = {
+    "dangerous": "Dangerous pattern detected",
+    "sql": "SQL injection pattern detected",
+}
+
+def iter_payload_strings(payload):
+    """Yield every string key and value in a decoded JSON payload"""
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
 class ApprovalSystem:
     """Handles the required approval system: Safety Approval → Enforcement Approval → Execution"""
     
     @staticmethod
-    def is_safety_approved(payload):
-        """Check if payload passes safety approval"""
+    def is_safety_approved(payload, raw_body=None):
+        """Check if payload passes safety approval
+        
+        raw_body is the undecoded request body the payload was parsed from,
+        if available.
+        """
         try:
             # Basic safety checks
             if not payload:
                 return False, "Empty payload"
             
-            # Check for malicious content
-            content_str = json.dumps(payload) if isinstance(payload, dict) else str(payload)
+            # Check for malicious content. A pure-ASCII body without backslash
+            # escapes holds exactly the text of its decoded strings, so it is
+            # scanned as bytes; anything else is scanned leaf by leaf after decoding.
+            if raw_body is not None and raw_body.isascii() and b'\\' not in raw_body:
+                match = SAFETY_PATTERN_BYTES_RE.search(raw_body.lower())
+                if match:
+                    return False, f"{SAFETY_VIOLATION_MESSAGES[match.lastgroup]}: {match.group(0).decode('ascii')}"
+                return True, "Approved"
             
-            # Simple safety checks (in real implementation, this would be more sophisticated)
-            dangerous_patterns = ["exec(", "eval(", "__import__", "os.system", "subprocess", "import os"]
-            for pattern in dangerous_patterns:
-                if pattern.lower() in content_str.lower():
-                    return False, f"Dangerous pattern detected: {pattern}"
+            strings = iter_payload_strings(payload) if isinstance(payload, (dict, list)) else (str(payload),)
             
-            # Check for SQL injection patterns
-            sql_patterns = [r"drop\s+table", r"drop\s+database", r";\s*drop", r"union\s+select", r"'or\s+1=1"]
-            for pattern in sql_patterns:
-                if re.search(pattern, content_str, re.IGNORECASE):
-                    return False, f"SQL injection pattern detected: {pattern}"
+            # Simple safety checks (in real implementation, this would be more sophisticated)
+            # Dangerous code and SQL injection patterns are checked in one pass
+            for content_str in strings:
+                # casefold() also folds characters like the long s that IGNORECASE matched
+                match = SAFETY_PATTERN_RE.search(content_str.casefold())
+                if match:
+                    return False, f"{SAFETY_VIOLATION_MESSAGES[match.lastgroup]}: {match.group(0)}"
             
             return True, "Approved"
         except Exception as e:
-            logger.error(f"Safety approval error: {e}")
+            logger.error("Safety approval error: %s", e)
             return False, f"Safety approval error: {str(e)}"
     
     @staticmethod
@@ -96,22 +178,22 @@ class ApprovalSystem:
             
             return True, "Approved"
         except Exception as e:
-            logger.error(f"Enforcement approval error: {e}")
+            logger.error("Enforcement approval error: %s", e)
             return False, f"Enforcement approval error: {str(e)}"
 
 def requires_approval(handler):
     """Decorator to enforce approval system"""
-    def wrapper(self, request_data, path):
+    def wrapper(self, request_data, path, raw_body=None):
         # Check safety approval
-        safety_approved, safety_msg = ApprovalSystem.is_safety_approved(request_data)
+        safety_approved, safety_msg = ApprovalSystem.is_safety_approved(request_data, raw_body)
         if not safety_approved:
-            logger.warning(f"Safety approval failed: {safety_msg}")
+            logger.warning("Safety approval failed: %s", safety_msg)
             response = {
                 "status": "safety_rejected",
                 "error": safety_msg,
                 "message": "Request rejected by safety approval system",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 403)
             return
@@ -119,13 +201,13 @@ def requires_approval(handler):
         # Check enforcement approval
         enforcement_approved, enforcement_msg = ApprovalSystem.is_enforcement_approved(request_data)
         if not enforcement_approved:
-            logger.warning(f"Enforcement approval failed: {enforcement_msg}")
+            logger.warning("Enforcement approval failed: %s", enforcement_msg)
             response = {
                 "status": "enforcement_rejected", 
                 "error": enforcement_msg,
                 "message": "Request rejected by enforcement approval system",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 403)
             return
@@ -134,28 +216,439 @@ def requires_approval(handler):
         return handler(self, request_data, path)
     return wrapper
 
+# Content-Type and CORS headers shared by every JSON response
+JSON_RESPONSE_HEADERS = (
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS, PUT, DELETE\r\n"
+    b"Access-Control-Allow-Headers: *\r\n"
+)
+
+def dumps_json(data):
+    """Serialize a response body to compact JSON bytes"""
+    if ORJSON_AVAILABLE:
+        # Non-str dict keys are stringified like json.dumps (and FastAPI's
+        # ORJSONResponse) do; some responses are keyed by client input
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+# Static GET responses are serialized once; only the timestamp and trace_id
+# slots are filled in per request. The slots are sentinel objects rather than
+# placeholder strings so no serialized value can be mistaken for one.
+TIMESTAMP_SLOT = object()
+TRACE_ID_SLOT = object()
+
+# Request bodies above this size are rejected with 413 before being read
+MAX_REQUEST_BODY_BYTES = 256 * 1024
+
+# Upper bound on queries accepted in one /nyaya/multi_jurisdiction batch
+MAX_MULTI_JURISDICTION_BATCH = 20
+
+# A run of 20+ digits may be an integer wider than 64 bits, which orjson
+# either rejects or rounds to a float depending on its version
+WIDE_INTEGER_RE = re.compile(rb"\d{20}")
+
+def loads_json(data):
+    """Parse a JSON request body (bytes)"""
+    if ORJSON_AVAILABLE and not WIDE_INTEGER_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Only a body json.loads refuses as well is treated as invalid
+            pass
+    return json.loads(data)
+
+def check_batch_queries(queries):
+    """Validate the queries list of a batched multi-jurisdiction request
+    
+    Returns (error, message) for an invalid batch, None otherwise.
+    """
+    if not isinstance(queries, list) or not queries:
+        return "Queries must be a non-empty list", "Validation failed: queries must be a non-empty list"
+    if len(queries) > MAX_MULTI_JURISDICTION_BATCH:
+        return "Too many queries in batch", f"Validation failed: at most {MAX_MULTI_JURISDICTION_BATCH} queries per batch"
+    return None
+
+def parse_batch_query(item):
+    """Validate one entry of a batched multi-jurisdiction request
+    
+    Returns (query, jurisdictions, error); error is None for a valid entry.
+    """
+    if not isinstance(item, dict):
+        item = {}
+    query = item.get('query')
+    query = query.strip() if isinstance(query, str) else ''
+    if not query:
+        return query, None, "Query must be a non-empty string"
+    jurisdictions = item.get('jurisdictions')
+    # A string would otherwise be sliced into single characters
+    if not isinstance(jurisdictions, list) or not jurisdictions or not all(isinstance(j, str) for j in jurisdictions):
+        return query, None, "Jurisdictions must be a non-empty list of strings"
+    return query, jurisdictions, None
+
+def build_response_template(response):
+    """Serialize a response dict around its top-level timestamp/trace_id slots
+    
+    Returns the byte pieces between the slots and the slots in order.
+    """
+    pieces, slots = [], []
+    current = b"{"
+    # Top-level items are serialized one by one (the same bytes as a compact
+    # dump of the whole dict) and the body is cut open at each slot value
+    for i, (key, value) in enumerate(response.items()):
+        current += (b"," if i else b"") + dumps_json(key) + b":"
+        if value is TIMESTAMP_SLOT or value is TRACE_ID_SLOT:
+            pieces.append(current + b'"')
+            slots.append(value)
+            current = b'"'
+        else:
+            current += dumps_json(value)
+    pieces.append(current + b"}")
+    return tuple(pieces), tuple(slots)
+
+def fill_response_template(template):
+    """Fill in a fresh timestamp and trace_id for a pre-serialized response"""
+    pieces, slots = template
+    values = {
+        TIMESTAMP_SLOT: now_iso().encode('ascii'),
+        TRACE_ID_SLOT: uuid.uuid4().hex.encode('ascii')
+    }
+    body = [pieces[0]]
+    for slot, piece in zip(slots, pieces[1:]):
+        body.append(values[slot])
+        body.append(piece)
+    return b"".join(body)
+
+ROOT_RESPONSE_TEMPLATE = build_response_template({
+    "service": "Nyaya Integrated Backend",
+    "version": "6.0.0",
+    "status": "operational",
+    "message": "All systems operational with comprehensive error handling",
+    "endpoints": {
+        "root": "GET /",
+        "health": "GET /health",
+        "docs": "GET /docs",
+        "legal_query": "POST /api/legal/query",
+        "nyaya_query": "POST /nyaya/query",
+        "multi_jurisdiction": "POST /nyaya/multi_jurisdiction",
+        "feedback": "POST /nyaya/feedback",
+        "explain_reasoning": "POST /nyaya/explain_reasoning",
+        "webhook": "GET|POST /webhook/*",
+        "trace": "GET /nyaya/trace/{trace_id}",
+        "debug_endpoints": [
+            "GET /debug/info",
+            "GET /debug/nonce-state",
+            "POST /debug/test-nonce",
+            "GET /debug/generate-nonce"
+        ]
+    },
+    "repositories_integrated": [
+        "AI_ASSISTANT_PhaseB_Integration",
+        "Nyaya_AI", 
+        "nyaya-legal-procedure-datasets"
+    ],
+    "deployment_status": "production_ready",
+    "security": {
+        "safety_approval": "active",
+        "enforcement_approval": "active",
+        "signature_validation": "ready",
+        "rate_limiting": "active"
+    },
+    "timestamp": TIMESTAMP_SLOT,
+    "trace_id": TRACE_ID_SLOT
+})
+
+NONCE_STATE_RESPONSE_TEMPLATE = build_response_template({
+    "status": "nonce_state_retrieved",
+    "pending_nonces_count": 0,
+    "pending_nonces": [],
+    "used_nonces_count": 15,
+    "used_nonces": ["nonce1", "nonce2", "nonce3"],  # Sample data
+    "ttl_seconds": 300,
+    "instance_id": "debug_nonce_manager_12345",
+    "message": "Nonce manager state information (simulated for debug purposes)",
+    "timestamp": TIMESTAMP_SLOT,
+    "trace_id": TRACE_ID_SLOT
+})
+
+DOCS_RESPONSE_TEMPLATE = build_response_template({
+    "status": "documentation_available",
+    "title": "Nyaya Integrated Backend API Documentation",
+    "version": "6.0.0",
+    "description": "Sovereign-compliant API for multi-agent legal intelligence",
+    "endpoints": {
+        "GET": {
+            "/": "Root endpoint with system overview",
+            "/health": "Health check and system status",
+            "/debug/info": "Debug information and system details",
+            "/docs": "This API documentation",
+            "/nyaya/trace/{trace_id}": "Retrieve provenance chain for specific trace"
+        },
+        "POST": {
+            "/api/legal/query": "Process legal queries with jurisdiction routing",
+            "/nyaya/query": "Enhanced Nyaya legal queries with provenance",
+            "/nyaya/multi_jurisdiction": "Multi-jurisdiction legal analysis",
+            "/nyaya/feedback": "Submit system feedback and ratings",
+            "/nyaya/explain_reasoning": "Get detailed reasoning explanation",
+            "/webhook/*": "Secure webhook processing"
+        }
+    },
+    "schemas": {
+        "query_request": {
+            "query": "string (required) - Legal query text",
+            "jurisdiction_hint": "string (optional) - Target jurisdiction (IN, UK, UAE)",
+            "domain_hint": "string (optional) - Legal domain (criminal, civil, constitutional)"
+        },
+        "feedback_request": {
+            "trace_id": "string (required) - UUID trace identifier",
+            "rating": "integer (1-5) - Feedback rating",
+            "feedback_type": "string (clarity, correctness, usefulness)",
+            "comment": "string (optional) - Additional feedback comments"
+        },
+        "explain_request": {
+            "trace_id": "string (required) - UUID trace identifier",
+            "explanation_level": "string (brief, detailed, constitutional)"
+        }
+    },
+    "security": {
+        "approval_system": "Active - Safety and enforcement validation required",
+        "signature_validation": "Available for webhook endpoints",
+        "rate_limiting": "Active"
+    },
+    "timestamp": TIMESTAMP_SLOT,
+    "trace_id": TRACE_ID_SLOT
+})
+# Keyed by whether the PORT environment variable check passed
+HEALTH_RESPONSE_TEMPLATES = {
+    env_check: build_response_template({
+        "status": "healthy",
+        "timestamp": TIMESTAMP_SLOT,
+        "service": "Nyaya Integrated Backend",
+        "version": "6.0.0",
+        "components": {
+            "api_server": "operational",
+            "error_handling": "active",
+            "approval_system": "active",
+            "env_vars_check": "passed" if env_check else "warning",
+            "response_guarantee": "200_OK"
+        },
+        "message": "All systems healthy with comprehensive error handling",
+        "repositories_integrated": 3,
+        "trace_id": TRACE_ID_SLOT
+    })
+    for env_check in (True, False)
+}
+
+@functools.lru_cache(maxsize=8)
+def debug_info_template(working_directory, python_path, port, python_version, api_key_set):
+    """Pre-serialized /debug/info response for the given process state"""
+    return build_response_template({
+        "python_version": sys.version,
+        "working_directory": working_directory,
+        "environment_variables": {
+            "PORT": port,
+            "PYTHON_VERSION": python_version,
+            "API_KEY_SET": api_key_set
+        },
+        "python_path": list(python_path),
+        "timestamp": TIMESTAMP_SLOT,
+        "status": "debug_info_available",
+        "trace_id": TRACE_ID_SLOT
+    })
+
+# Fixed reasoning_trace factors reported by /nyaya/query
+NYAYA_CONFIDENCE_FACTORS = ("query_specificity", "data_availability", "jurisdiction_matching")
+
+# Canned reasoning explanations for /nyaya/explain_reasoning, keyed by level;
+# each entry is (explanation, reasoning_tree). Built once and shared read-only
+# between requests.
+REASONING_EXPLANATIONS = {
+    "brief": (
+        {
+            "summary": "Query processed successfully through jurisdiction routing",
+            "confidence": 0.85,
+            "key_steps": ["Query received", "Jurisdiction identified", "Legal analysis performed", "Response generated"],
+            "processing_time": "0.45 seconds"
+        },
+        {
+            "root": "query_processing",
+            "children": [
+                {"step": "jurisdiction_routing", "confidence": 0.9},
+                {"step": "legal_analysis", "confidence": 0.85}
+            ]
+        }
+    ),
+    "detailed": (
+        {
+            "query_analysis": {
+                "original_query": "Sample legal query",
+                "identified_domain": "CIVIL",
+                "target_jurisdiction": "IN",
+                "confidence_factors": ["query_clarity", "domain_match", "jurisdiction_availability"]
+            },
+            "processing_details": {
+                "agents_involved": ["jurisdiction_router", "legal_agent_IN"],
+                "execution_steps": 4,
+                "total_processing_time": "0.45 seconds",
+                "resource_utilization": "low"
+            },
+            "decision_rationale": {
+                "jurisdiction_selection": "Based on domain_hint and query content",
+                "confidence_calculation": "Weighted average of routing and analysis confidence",
+                "alternative_considerations": ["UK jurisdiction also considered but lower confidence"]
+            }
+        },
+        {
+            "root": {
+                "step": "query_processing",
+                "details": "Initial query processing and validation"
+            },
+            "routing": {
+                "step": "jurisdiction_routing",
+                "confidence": 0.9,
+                "details": "Identified India as primary jurisdiction"
+            },
+            "analysis": {
+                "step": "legal_analysis",
+                "confidence": 0.85,
+                "details": "Performed civil law analysis for property rights"
+            },
+            "response": {
+                "step": "response_generation",
+                "confidence": 0.95,
+                "details": "Generated comprehensive legal guidance"
+            }
+        }
+    ),
+    "constitutional": (
+        {
+            "constitutional_basis": {
+                "relevant_articles": ["Article 14", "Article 19", "Article 21"],
+                "fundamental_rights_impact": "Right to property and equality before law",
+                "constitutional_principles_applied": ["Natural justice", "Due process", "Legal certainty"]
+            },
+            "jurisdictional_constitutional_framework": {
+                "applicable_constitution": "Constitution of India",
+                "constitutional_courts": ["Supreme Court", "High Courts"],
+                "constitutional_remedies": ["Writ petitions", "Constitutional appeals"]
+            },
+            "sovereign_compliance": {
+                "constitutional_sovereignty": "Maintained throughout processing",
+                "fundamental_duty_alignment": "Aligned with citizen welfare duties",
+                "constitutional_values_preserved": ["Justice", "Liberty", "Equality", "Fraternity"]
+            }
+        },
+        {
+            "constitutional_root": {
+                "step": "constitutional_analysis",
+                "constitutional_articles": ["Article 14", "Article 19", "Article 21"],
+                "fundamental_rights": ["Right to Property", "Equality before Law"]
+            },
+            "jurisdictional_compliance": {
+                "step": "sovereign_compliance_check",
+                "constitutional_alignment": "Full alignment achieved",
+                "sovereign_principles": ["Justice", "Liberty", "Equality"]
+            }
+        }
+    )
+}
+
 class IntegratedNyayaHandler(BaseHTTPRequestHandler):
     """Production-grade HTTP handler with comprehensive error handling for integrated backend"""
     
+    # Persistent HTTP/1.1 connections; every response carries Content-Length.
+    # Idle keep-alive connections are dropped after `timeout` seconds so they
+    # do not hold one of the server's connection slots indefinitely.
+    protocol_version = "HTTP/1.1"
+    timeout = 15
+    wbufsize = 65536
+    
     def log_message(self, format, *args):
         """Override to use our logger"""
-        logger.info(f"{self.address_string()} - {format % args}")
+        # The access-log format is passed through so it is only applied
+        # when INFO records are actually emitted
+        logger.info("%s - " + format, self.address_string(), *args)
+    
+    def parse_request(self):
+        """Parse the request line and headers, rejecting body framing other than Content-Length"""
+        if not super().parse_request():
+            return False
+        
+        # Bodies are only ever read by Content-Length. With any other framing
+        # the body bytes would stay on the socket and be parsed as the next
+        # request on a kept-alive connection, so those requests are refused
+        # and the connection is closed.
+        if 'Transfer-Encoding' in self.headers:
+            self.close_connection = True
+            response = {
+                "status": "length_required",
+                "error": "Transfer-Encoding is not supported",
+                "message": "Request bodies must be sent with a Content-Length header",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 411)
+            return False
+        
+        lengths = set(self.headers.get_all('Content-Length', ()))
+        if len(lengths) > 1 or any(not (value.isascii() and value.isdigit()) for value in lengths):
+            self.close_connection = True
+            response = {
+                "status": "bad_request",
+                "error": "Invalid Content-Length header",
+                "message": "Content-Length must be a single non-negative integer",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return False
+        self.content_length = int(lengths.pop()) if lengths else 0
+        
+        # Only POST reads its body; any other request that carries one
+        # leaves it unread, so the connection cannot be reused
+        if self.content_length and self.command != 'POST':
+            self.close_connection = True
+        return True
+    
+    def end_headers(self):
+        """Finish headers written through send_response, flagging a closing connection"""
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        super().end_headers()
+    
+    def send_json_bytes(self, body, status_code=200):
+        """Send an already serialized JSON body with proper headers"""
+        # Status line, headers and body go out in a single write instead of
+        # one small write per send_header call
+        self.log_request(status_code)
+        status_line = "%s %d %s\r\nServer: %s\r\nDate: %s\r\n" % (
+            self.protocol_version,
+            status_code,
+            self.responses.get(status_code, ('',))[0],
+            self.version_string(),
+            self.date_time_string()
+        )
+        # Tell the client when the connection will not be reused, so a
+        # keep-alive or pipelining client does not send into a closed socket
+        connection_header = b"Connection: close\r\n" if self.close_connection else b""
+        self.wfile.write(
+            status_line.encode('latin-1', 'strict')
+            + JSON_RESPONSE_HEADERS
+            + connection_header
+            + b"Content-Length: %d\r\n\r\n" % len(body)
+            + body
+        )
     
     def send_json_response(self, data, status_code=200):
         """Send JSON response with proper headers"""
-        self.send_response(status_code)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS, PUT, DELETE')
-        self.send_header('Access-Control-Allow-Headers', '*')
-        self.end_headers()
         try:
-            self.wfile.write(json.dumps(data, indent=2).encode('utf-8'))
+            body = dumps_json(data)
         except Exception as e:
-            logger.error(f"Error sending response: {e}")
+            logger.error("Error sending response: %s", e)
             # Fallback response if JSON serialization fails
-            fallback_data = {"status": "response_error", "error": str(e), "trace_id": str(uuid.uuid4())}
-            self.wfile.write(json.dumps(fallback_data).encode('utf-8'))
+            fallback_data = {"status": "response_error", "error": str(e), "trace_id": uuid.uuid4().hex}
+            body = json.dumps(fallback_data).encode('utf-8')
+        self.send_json_bytes(body, status_code)
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
@@ -163,6 +656,7 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS, PUT, DELETE')
         self.send_header('Access-Control-Allow-Headers', '*')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def safe_get_env(self, key, default=None):
@@ -170,29 +664,30 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
         try:
             value = os.environ.get(key, default)
             if value is None and default is None:
-                logger.warning(f"Environment variable '{key}' not found")
+                logger.warning("Environment variable '%s' not found", key)
             return value
         except Exception as e:
-            logger.error(f"Error accessing environment variable '{key}': {e}")
+            logger.error("Error accessing environment variable '%s': %s", key, e)
             return default
     
-    def validate_signature(self, headers, body, secret):
-        """Validate webhook signatures (Meta/Twilio style)"""
+    @staticmethod
+    def validate_signature(headers, body, secret):
+        """Validate webhook signatures (Meta/Twilio style) against the raw body bytes"""
         try:
-            signature = headers.get('X-Hub-Signature', headers.get('X-Twilio-Signature', ''))
+            signature = headers.get('X-Hub-Signature-256', headers.get('X-Twilio-Signature', ''))
             if not signature or not secret:
                 return True  # Skip validation if no signature/secret provided (for development)
             
             expected_signature = hmac.new(
                 secret.encode('utf-8'),
-                body.encode('utf-8'),
-                hashlib.sha1
+                body,
+                hashlib.sha256
             ).hexdigest()
             
-            expected_header = f"sha1={expected_signature}"
+            expected_header = f"sha256={expected_signature}"
             return hmac.compare_digest(signature, expected_header)
         except Exception as e:
-            logger.error(f"Signature validation error: {e}")
+            logger.error("Signature validation error: %s", e)
             return False
     
     def verify_challenge(self, params, challenge_param='hub.challenge'):
@@ -203,286 +698,184 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 return challenge
             return None
         except Exception as e:
-            logger.error(f"Challenge verification error: {e}")
+            logger.error("Challenge verification error: %s", e)
             return None
     
     def do_GET(self):
         """Handle GET requests with comprehensive error handling"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        query_params = parse_qs(parsed_path.query)
+        # A plain split is enough here; the query string is only parsed
+        # for the webhook challenge
+        path, _, query_string = self.path.partition('?')
         
         try:
-            # Handle webhook verification challenge
-            if path.startswith('/webhook'):
-                challenge = self.verify_challenge(query_params)
-                if challenge:
-                    # Send challenge back for verification
-                    self.send_response(200)
-                    self.send_header('Content-type', 'text/plain')
-                    self.end_headers()
-                    self.wfile.write(challenge.encode('utf-8'))
-                    return
-            
-            # Handle nyaya trace endpoint
-            if path.startswith('/nyaya/trace/'):
-                trace_id = path.split('/')[-1]
-                if not trace_id or len(trace_id) < 5:
-                    response = {
-                        "status": "trace_not_found",
-                        "error": "Invalid trace_id",
-                        "message": "Trace ID must be at least 5 characters long",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 404)
-                    return
-                
-                # Simulate trace retrieval (would connect to provenance chain in real implementation)
-                response = {
-                    "trace_id": trace_id,
-                    "status": "found",
-                    "provenance_chain": [
-                        {
-                            "step": "RECEIVED_QUERY",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "component": "API_Gateway",
-                            "details": "Query received and validated"
-                        },
-                        {
-                            "step": "ROUTED_TO_AGENT",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "component": "JurisdictionRouter",
-                            "details": "Query routed to appropriate legal agent"
-                        },
-                        {
-                            "step": "AGENT_PROCESSED",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "component": "LegalAgent",
-                            "details": "Legal analysis completed"
-                        }
-                    ],
-                    "message": "Full sovereign audit trail retrieved",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                self.send_json_response(response, 200)
-                return
-            
-            # Handle regular endpoints
-            if path == '/':
-                response = {
-                    "service": "Nyaya Integrated Backend",
-                    "version": "6.0.0",
-                    "status": "operational",
-                    "message": "All systems operational with comprehensive error handling",
-                    "endpoints": {
-                        "root": "GET /",
-                        "health": "GET /health",
-                        "docs": "GET /docs",
-                        "legal_query": "POST /api/legal/query",
-                        "nyaya_query": "POST /nyaya/query",
-                        "multi_jurisdiction": "POST /nyaya/multi_jurisdiction",
-                        "feedback": "POST /nyaya/feedback",
-                        "explain_reasoning": "POST /nyaya/explain_reasoning",
-                        "webhook": "GET|POST /webhook/*",
-                        "trace": "GET /nyaya/trace/{trace_id}",
-                        "debug_endpoints": [
-                            "GET /debug/info",
-                            "GET /debug/nonce-state",
-                            "POST /debug/test-nonce",
-                            "GET /debug/generate-nonce"
-                        ]
-                    },
-                    "repositories_integrated": [
-                        "AI_ASSISTANT_PhaseB_Integration",
-                        "Nyaya_AI", 
-                        "nyaya-legal-procedure-datasets"
-                    ],
-                    "deployment_status": "production_ready",
-                    "security": {
-                        "safety_approval": "active",
-                        "enforcement_approval": "active",
-                        "signature_validation": "ready",
-                        "rate_limiting": "active"
-                    },
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/health':
-                # Check system health including environment variables
-                env_check = bool(self.safe_get_env("PORT"))
-                response = {
-                    "status": "healthy",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "service": "Nyaya Integrated Backend",
-                    "version": "6.0.0",
-                    "components": {
-                        "api_server": "operational",
-                        "error_handling": "active",
-                        "approval_system": "active",
-                        "env_vars_check": "passed" if env_check else "warning",
-                        "response_guarantee": "200_OK"
-                    },
-                    "message": "All systems healthy with comprehensive error handling",
-                    "repositories_integrated": 3,
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/debug/info':
-                response = {
-                    "python_version": sys.version,
-                    "working_directory": os.getcwd(),
-                    "environment_variables": {
-                        "PORT": self.safe_get_env("PORT", "not_set"),
-                        "PYTHON_VERSION": self.safe_get_env("PYTHON_VERSION", "not_set"),
-                        "API_KEY_SET": bool(self.safe_get_env("API_KEY"))
-                    },
-                    "python_path": sys.path[:3],
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "status": "debug_info_available",
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/debug/nonce-state':
-                # Debug endpoint to check nonce manager state (simulated)
-                response = {
-                    "status": "nonce_state_retrieved",
-                    "pending_nonces_count": 0,
-                    "pending_nonces": [],
-                    "used_nonces_count": 15,
-                    "used_nonces": ["nonce1", "nonce2", "nonce3"],  # Sample data
-                    "ttl_seconds": 300,
-                    "instance_id": "debug_nonce_manager_12345",
-                    "message": "Nonce manager state information (simulated for debug purposes)",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/debug/test-nonce':
-                # Debug endpoint to test nonce generation and validation (simulated)
-                import time
-                nonce = "debug_nonce_" + str(uuid.uuid4())[:8]
-                
-                response = {
-                    "status": "nonce_test_completed",
-                    "generated_nonce": nonce,
-                    "validation_result": True,
-                    "pending_nonces_count": 1,
-                    "used_nonces_count": 15,
-                    "current_time": time.time(),
-                    "instance_id": "debug_nonce_manager_12345",
-                    "message": "Nonce generation and validation test completed (simulated)",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/debug/generate-nonce':
-                # Endpoint to generate a valid nonce for testing
-                nonce = "test_nonce_" + str(uuid.uuid4())[:12]
-                
-                response = {
-                    "status": "nonce_generated",
-                    "nonce": nonce,
-                    "message": "Use this nonce in your next API request",
-                    "expires_in_seconds": 300,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/docs':
-                # Documentation endpoint
-                response = {
-                    "status": "documentation_available",
-                    "title": "Nyaya Integrated Backend API Documentation",
-                    "version": "6.0.0",
-                    "description": "Sovereign-compliant API for multi-agent legal intelligence",
-                    "endpoints": {
-                        "GET": {
-                            "/": "Root endpoint with system overview",
-                            "/health": "Health check and system status",
-                            "/debug/info": "Debug information and system details",
-                            "/docs": "This API documentation",
-                            "/nyaya/trace/{trace_id}": "Retrieve provenance chain for specific trace"
-                        },
-                        "POST": {
-                            "/api/legal/query": "Process legal queries with jurisdiction routing",
-                            "/nyaya/query": "Enhanced Nyaya legal queries with provenance",
-                            "/nyaya/multi_jurisdiction": "Multi-jurisdiction legal analysis",
-                            "/nyaya/feedback": "Submit system feedback and ratings",
-                            "/nyaya/explain_reasoning": "Get detailed reasoning explanation",
-                            "/webhook/*": "Secure webhook processing"
-                        }
-                    },
-                    "schemas": {
-                        "query_request": {
-                            "query": "string (required) - Legal query text",
-                            "jurisdiction_hint": "string (optional) - Target jurisdiction (IN, UK, UAE)",
-                            "domain_hint": "string (optional) - Legal domain (criminal, civil, constitutional)"
-                        },
-                        "feedback_request": {
-                            "trace_id": "string (required) - UUID trace identifier",
-                            "rating": "integer (1-5) - Feedback rating",
-                            "feedback_type": "string (clarity, correctness, usefulness)",
-                            "comment": "string (optional) - Additional feedback comments"
-                        },
-                        "explain_request": {
-                            "trace_id": "string (required) - UUID trace identifier",
-                            "explanation_level": "string (brief, detailed, constitutional)"
-                        }
-                    },
-                    "security": {
-                        "approval_system": "Active - Safety and enforcement validation required",
-                        "signature_validation": "Available for webhook endpoints",
-                        "rate_limiting": "Active"
-                    },
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            elif path.startswith('/webhook'):  # Additional webhook routes
-                response = {
-                    "status": "webhook_endpoint",
-                    "message": "Webhook endpoint ready for integration",
-                    "capabilities": ["signature_validation", "challenge_verification", "secure_processing"],
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
-                
-            else:
-                # For any unknown GET path, return 200 with helpful message
-                response = {
-                    "status": "endpoint_not_found",
-                    "requested_path": path,
-                    "available_endpoints": ["/", "/health", "/debug/info", "/webhook/*", "/nyaya/trace/{trace_id}"],
-                    "message": "Unknown endpoint, returning 200 with available endpoints",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
-                }
-                self.send_json_response(response, 200)
+            # Exact paths resolve with one dict lookup; only the few prefix
+            # routes are checked one by one
+            handler = self.GET_ROUTES.get(path)
+            if handler is None:
+                for prefix, prefix_handler in self.GET_PREFIX_ROUTES:
+                    if path.startswith(prefix):
+                        handler = prefix_handler
+                        break
+                else:
+                    handler = IntegratedNyayaHandler.handle_unknown_get
+            handler(self, path, query_string)
                 
         except Exception as e:
-            logger.error(f"GET error: {e}")
-            logger.error(traceback.format_exc())
+            logger.error("GET error: %s", e)
+            # Full tracebacks are only formatted when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             # Never return 500 - return error info as 200
             response = {
                 "status": "get_error_handled",
                 "error_type": type(e).__name__,
                 "error_message": str(e),
                 "message": "GET request error handled gracefully",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 200)
     
+    def handle_trace(self, path, query_string):
+        """Handle nyaya trace endpoint"""
+        trace_id = path.rpartition('/')[2]
+        if not trace_id or len(trace_id) < 5:
+            response = {
+                "status": "trace_not_found",
+                "error": "Invalid trace_id",
+                "message": "Trace ID must be at least 5 characters long",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 404)
+            return
+        
+        # Simulate trace retrieval (would connect to provenance chain in real implementation)
+        response = {
+            "trace_id": trace_id,
+            "status": "found",
+            "provenance_chain": [
+                {
+                    "step": "RECEIVED_QUERY",
+                    "timestamp": now_iso(),
+                    "component": "API_Gateway",
+                    "details": "Query received and validated"
+                },
+                {
+                    "step": "ROUTED_TO_AGENT",
+                    "timestamp": now_iso(),
+                    "component": "JurisdictionRouter",
+                    "details": "Query routed to appropriate legal agent"
+                },
+                {
+                    "step": "AGENT_PROCESSED",
+                    "timestamp": now_iso(),
+                    "component": "LegalAgent",
+                    "details": "Legal analysis completed"
+                }
+            ],
+            "message": "Full sovereign audit trail retrieved",
+            "timestamp": now_iso()
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_root(self, path, query_string):
+        """Root endpoint with system overview"""
+        self.send_json_bytes(fill_response_template(ROOT_RESPONSE_TEMPLATE), 200)
+    
+    def handle_health(self, path, query_string):
+        """Health check and system status"""
+        # Check system health including environment variables
+        env_check = bool(self.safe_get_env("PORT"))
+        self.send_json_bytes(fill_response_template(HEALTH_RESPONSE_TEMPLATES[env_check]), 200)
+    
+    def handle_debug_info(self, path, query_string):
+        """Debug information and system details"""
+        template = debug_info_template(
+            os.getcwd(),
+            tuple(sys.path[:3]),
+            self.safe_get_env("PORT", "not_set"),
+            self.safe_get_env("PYTHON_VERSION", "not_set"),
+            bool(self.safe_get_env("API_KEY"))
+        )
+        self.send_json_bytes(fill_response_template(template), 200)
+    
+    def handle_nonce_state(self, path, query_string):
+        """Debug endpoint to check nonce manager state (simulated)"""
+        self.send_json_bytes(fill_response_template(NONCE_STATE_RESPONSE_TEMPLATE), 200)
+    
+    def handle_test_nonce(self, path, query_string):
+        """Debug endpoint to test nonce generation and validation (simulated)"""
+        nonce = "debug_nonce_" + uuid.uuid4().hex[:8]
+        
+        response = {
+            "status": "nonce_test_completed",
+            "generated_nonce": nonce,
+            "validation_result": True,
+            "pending_nonces_count": 1,
+            "used_nonces_count": 15,
+            "current_time": time.time(),
+            "instance_id": "debug_nonce_manager_12345",
+            "message": "Nonce generation and validation test completed (simulated)",
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_generate_nonce(self, path, query_string):
+        """Endpoint to generate a valid nonce for testing"""
+        nonce = "test_nonce_" + uuid.uuid4().hex[:12]
+        
+        response = {
+            "status": "nonce_generated",
+            "nonce": nonce,
+            "message": "Use this nonce in your next API request",
+            "expires_in_seconds": 300,
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_docs(self, path, query_string):
+        """Documentation endpoint"""
+        self.send_json_bytes(fill_response_template(DOCS_RESPONSE_TEMPLATE), 200)
+    
+    def handle_webhook_get(self, path, query_string):
+        """Handle webhook verification challenge and webhook status"""
+        # Handle webhook verification challenge
+        if query_string:
+            challenge = self.verify_challenge(parse_qs(query_string))
+            if challenge:
+                # Send challenge back for verification
+                body = challenge.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-type', 'text/plain')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+        
+        response = {
+            "status": "webhook_endpoint",
+            "message": "Webhook endpoint ready for integration",
+            "capabilities": ["signature_validation", "challenge_verification", "secure_processing"],
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_unknown_get(self, path, query_string):
+        """For any unknown GET path, return 200 with helpful message"""
+        response = {
+            "status": "endpoint_not_found",
+            "requested_path": path,
+            "available_endpoints": ["/", "/health", "/debug/info", "/webhook/*", "/nyaya/trace/{trace_id}"],
+            "message": "Unknown endpoint, returning 200 with available endpoints",
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+        self.send_json_response(response, 200)
+    
     @requires_approval
     def handle_legal_query(self, request_data, path):
         """Handle legal query with approval system"""
@@ -494,8 +887,8 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 "status": "validation_error",
                 "error": "Query field is required",
                 "message": "Validation failed: query field is required",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 400)
             return
@@ -505,8 +898,8 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 "status": "validation_error",
                 "error": "Query must be at least 3 characters long",
                 "message": "Validation failed: query too short",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 400)
             return
@@ -514,17 +907,17 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
         # Check if legal data loader is available
         if legal_data_loader is None:
             response = {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": uuid.uuid4().hex,
                 "status": "error",
                 "error": "Legal data loader not available",
                 "message": "Legal data loader is not available for processing queries",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             self.send_json_response(response, 500)
             return
         
         # Process the legal query with real data from legal data loader
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         
         try:
             # Detect jurisdiction and classify domain
@@ -576,27 +969,26 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                     "reasoning": "Legal query processed with real data from jurisdiction databases",
                     "signed_proof": {
                         "hash": "integrated_proof_" + trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "integrated_system"
                     },
                     "processing_mode": "data_driven_backend"
                 },
                 "message": legal_response["message"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             
             self.send_json_response(response, 200)
             
         except Exception as e:
-            logger.error(f"Error processing legal query: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error processing legal query: %s", e)
             
             response = {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": trace_id,
                 "status": "error",
                 "error": "Internal server error occurred while processing query",
                 "message": "An error occurred while retrieving legal information",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             self.send_json_response(response, 500)
             return
@@ -612,8 +1004,8 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 "status": "validation_error",
                 "error": "Query field is required",
                 "message": "Validation failed: query field is required",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 400)
             return
@@ -623,8 +1015,8 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 "status": "validation_error",
                 "error": "Query must be at least 3 characters long",
                 "message": "Validation failed: query too short",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
             self.send_json_response(response, 400)
             return
@@ -632,17 +1024,17 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
         # Check if legal data loader is available
         if legal_data_loader is None:
             response = {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": uuid.uuid4().hex,
                 "status": "error",
                 "error": "Legal data loader not available",
                 "message": "Legal data loader is not available for processing queries",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             self.send_json_response(response, 500)
             return
         
         # Process the Nyaya query with real data from legal data loader
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         
         try:
             # Detect jurisdiction and classify domain
@@ -690,25 +1082,25 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                 "provenance_chain": [
                     {
                         "step": "QUERY_RECEIVED",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "API_GATEWAY",
                         "details": "Query received and validated"
                     },
                     {
                         "step": "JURISDICTION_DETECTION",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "DOMAIN_CLASSIFIER",
                         "details": f"Detected jurisdiction: {jurisdiction}"
                     },
                     {
                         "step": "LEGAL_DATA_FETCH",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "LEGAL_DATABASE",
                         "details": f"Retrieved {len(legal_data) if legal_data else 0} legal provisions"
                     },
                     {
                         "step": "APPROVAL_CHECK",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "APPROVAL_SYSTEM",
                         "details": "Safety and enforcement approval passed"
                     }
@@ -717,403 +1109,433 @@ class IntegratedNyayaHandler(BaseHTTPRequestHandler):
                     "jurisdiction_rationale": f"Based on query content and {jurisdiction} legal framework",
                     "domain_classification": f"{domain}/{subdomain} with confidence {domain_confidence:.2f}",
                     "data_sources": [f"{jurisdiction.lower()}_law_dataset.json"],
-                    "confidence_factors": ["query_specificity", "data_availability", "jurisdiction_matching"]
+                    "confidence_factors": NYAYA_CONFIDENCE_FACTORS
+                },
+                "enforcement_metadata": {
+                    "status": "enforcement_approved",
+                    "rule_id": "NYAYA_INTEGRATION_RULE_001",
+                    "decision": "ALLOW",
+                    "reasoning": "Query processed with real legal data from jurisdiction databases",
+                    "signed_proof": {
+                        "hash": "nyaya_proof_" + trace_id[:8],
+                        "timestamp": now_iso(),
+                        "validator": "nyaya_enforcement_engine"
+                    },
+                    "processing_mode": "sovereign_compliant_data_driven"
+                },
+                "message": legal_response["message"],
+                "timestamp": now_iso()
+            }
+            
+            self.send_json_response(response, 200)
+            
+        except Exception as e:
+            logger.exception("Error processing Nyaya query: %s", e)
+            
+            response = {
+                "trace_id": trace_id,
+                "status": "error",
+                "error": "Internal server error occurred while processing query",
+                "message": "An error occurred while retrieving legal information",
+                "timestamp": now_iso()
+            }
+            self.send_json_response(response, 500)
+            return
+    
+    def do_POST(self):
+        """Handle POST requests with comprehensive error handling and approval system"""
+        path = self.path.partition('?')[0]
+        
+        try:
+            # Content length was validated in parse_request
+            content_length = self.content_length
+            if content_length > MAX_REQUEST_BODY_BYTES:
+                # The body is left unread, so the connection cannot be reused
+                self.close_connection = True
+                response = {
+                    "status": "payload_too_large",
+                    "error": "Request body too large",
+                    "message": f"Request body must not exceed {MAX_REQUEST_BODY_BYTES} bytes",
+                    "timestamp": now_iso(),
+                    "trace_id": uuid.uuid4().hex
+                }
+                self.send_json_response(response, 413)
+                return
+            
+            # Kept as bytes: json.loads and the HMAC check both take bytes directly
+            post_data = self.rfile.read(content_length) if content_length > 0 else b""
+            
+            # For webhook endpoints, validate signature
+            if path.startswith('/webhook'):
+                webhook_secret = self.safe_get_env('WEBHOOK_SECRET', 'dev-secret')
+                if not self.validate_signature(self.headers, post_data, webhook_secret):
+                    logger.warning("Webhook signature validation failed")
+                    response = {
+                        "status": "signature_invalid",
+                        "error": "Invalid webhook signature",
+                        "message": "Webhook signature validation failed",
+                        "timestamp": now_iso(),
+                        "trace_id": uuid.uuid4().hex
+                    }
+                    self.send_json_response(response, 403)
+                    return
+            
+            # Parse JSON if possible
+            request_data = {}
+            if post_data.strip():
+                try:
+                    request_data = loads_json(post_data)
+                except ValueError:
+                    # JSONDecodeError, or UnicodeDecodeError for a non-UTF-8 body
+                    logger.warning("Invalid JSON received, treating as raw data")
+                    request_data = {"raw_body": post_data.decode('utf-8', 'replace'), "error": "invalid_json", "trace_id": uuid.uuid4().hex}
+            
+            # Route to appropriate handler
+            handler = self.POST_ROUTES.get(path, IntegratedNyayaHandler.handle_unknown_post)
+            handler(self, request_data, path, raw_body=post_data)
+                
+        except Exception as e:
+            logger.error("POST error: %s", e)
+            # Full tracebacks are only formatted when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
+            # The request body may not have been fully read, so the
+            # connection cannot safely be reused for another request
+            self.close_connection = True
+            # Never return 500 - return error info as 200
+            response = {
+                "status": "post_error_handled",
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "message": "POST request error handled gracefully",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 200)
+    
+    def handle_multi_jurisdiction(self, request_data, path, raw_body=None):
+        """Handle multi-jurisdiction query"""
+        # Several queries can be batched into one request
+        if request_data.get('queries') is not None:
+            self.handle_multi_jurisdiction_batch(request_data, raw_body)
+            return
+        
+        query = request_data.get('query', '').strip()
+        jurisdictions = request_data.get('jurisdictions', [])
+        
+        if not query:
+            response = {
+                "status": "validation_error",
+                "error": "Query field is required",
+                "message": "Validation failed: query field is required",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        if not jurisdictions:
+            response = {
+                "status": "validation_error",
+                "error": "Jurisdictions field is required",
+                "message": "Validation failed: jurisdictions field is required",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        # Process multi-jurisdiction query
+        trace_id = uuid.uuid4().hex
+        comparative_analysis = self.compare_jurisdictions(jurisdictions)
+        
+        response = {
+            "trace_id": trace_id,
+            "status": "multi_jurisdiction_processed",
+            "confidence": 0.85,
+            "comparative_analysis": comparative_analysis,
+            "enforcement_metadata": {
+                "status": "enforcement_approved",
+                "rule_id": "MULTI_JURISDICTION_RULE_001",
+                "decision": "ALLOW",
+                "reasoning": "Multi-jurisdiction query processed successfully",
+                "signed_proof": {
+                    "hash": "multi_proof_" + trace_id[:8],
+                    "timestamp": now_iso(),
+                    "validator": "multi_jurisdiction_engine"
+                }
+            },
+            "message": f"Multi-jurisdiction analysis completed for {len(comparative_analysis)} jurisdictions",
+            "timestamp": now_iso()
+        }
+        self.send_json_response(response, 200)
+    
+    def compare_jurisdictions(self, jurisdictions):
+        """Build the comparative analysis for a multi-jurisdiction query"""
+        comparative_analysis = {}
+        for jurisdiction in jurisdictions[:3]:  # Limit to first 3 for performance
+            comparative_analysis[jurisdiction] = {
+                "jurisdiction": jurisdiction,
+                "confidence": 0.82,
+                "analysis": f"Analysis for {jurisdiction} jurisdiction completed",
+                "legal_route": ["MULTI_JURISDICTION_ROUTE"],
+                "timestamp": now_iso()
+            }
+        return comparative_analysis
+    
+    def handle_multi_jurisdiction_batch(self, request_data, raw_body=None):
+        """Handle a batch of multi-jurisdiction queries in one response"""
+        # Safety approval runs once on the whole envelope
+        safety_approved, safety_msg = ApprovalSystem.is_safety_approved(request_data, raw_body)
+        if not safety_approved:
+            logger.warning("Safety approval failed: %s", safety_msg)
+            response = {
+                "status": "safety_rejected",
+                "error": safety_msg,
+                "message": "Request rejected by safety approval system",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 403)
+            return
+        
+        queries = request_data['queries']
+        invalid = check_batch_queries(queries)
+        if invalid:
+            error, message = invalid
+            response = {
+                "status": "validation_error",
+                "error": error,
+                "message": message,
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        # One trace_id and envelope for the whole batch; invalid entries are
+        # reported in place instead of failing the other queries
+        trace_id = uuid.uuid4().hex
+        results = []
+        for item in queries:
+            query, jurisdictions, error = parse_batch_query(item)
+            if error:
+                results.append({
+                    "query": query,
+                    "status": "validation_error",
+                    "error": error
+                })
+                continue
+            results.append({
+                "query": query,
+                "status": "multi_jurisdiction_processed",
+                "confidence": 0.85,
+                "comparative_analysis": self.compare_jurisdictions(jurisdictions)
+            })
+        
+        response = {
+            "trace_id": trace_id,
+            "status": "multi_jurisdiction_batch_processed",
+            "results": results,
+            "enforcement_metadata": {
+                "status": "enforcement_approved",
+                "rule_id": "MULTI_JURISDICTION_RULE_001",
+                "decision": "ALLOW",
+                "reasoning": "Multi-jurisdiction batch processed successfully",
+                "signed_proof": {
+                    "hash": "multi_proof_" + trace_id[:8],
+                    "timestamp": now_iso(),
+                    "validator": "multi_jurisdiction_engine"
+                }
+            },
+            "message": f"Multi-jurisdiction analysis completed for {len(results)} queries",
+            "timestamp": now_iso()
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_feedback(self, request_data, path, raw_body=None):
+        """Handle feedback submission with approval system"""
+        trace_id = request_data.get('trace_id', '').strip()
+        rating = request_data.get('rating')
+        feedback_type = request_data.get('feedback_type', '').strip()
+        comment = request_data.get('comment', '').strip()
+        
+        # Validate required fields
+        if not trace_id or len(trace_id) < 5:
+            response = {
+                "status": "validation_error",
+                "error": "Invalid trace_id provided",
+                "message": "Validation failed: trace_id is required and must be at least 5 characters",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        if rating is None or not isinstance(rating, int) or rating < 1 or rating > 5:
+            response = {
+                "status": "validation_error",
+                "error": "Invalid rating provided",
+                "message": "Validation failed: rating must be an integer between 1 and 5",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        valid_feedback_types = ['clarity', 'correctness', 'usefulness']
+        if not feedback_type or feedback_type not in valid_feedback_types:
+            response = {
+                "status": "validation_error",
+                "error": "Invalid feedback_type provided",
+                "message": f"Validation failed: feedback_type must be one of {valid_feedback_types}",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            }
+            self.send_json_response(response, 400)
+            return
+        
+        # Process feedback with enforcement check
+        feedback_trace_id = uuid.uuid4().hex
+        user_feedback = "positive" if rating >= 4 else "negative" if rating <= 2 else "neutral"
+        
+        # Simulate enforcement check (would integrate with real enforcement engine)
+        enforcement_permitted = True  # In real implementation, this would check enforcement policies
+        
+        if enforcement_permitted:
+            response = {
+                "status": "feedback_recorded",
+                "trace_id": feedback_trace_id,
+                "message": "Feedback recorded successfully",
+                "feedback_details": {
+                    "original_trace_id": trace_id,
+                    "rating": rating,
+                    "feedback_type": feedback_type,
+                    "comment_length": len(comment) if comment else 0,
+                    "user_feedback_classification": user_feedback
+                },
+                "enforcement_metadata": {
+                    "status": "enforcement_approved",
+                    "rule_id": "FEEDBACK_RULE_001",
+                    "decision": "ALLOW",
+                    "reasoning": "Feedback submission permitted by enforcement policy",
+                    "signed_proof": {
+                        "hash": "feedback_proof_" + feedback_trace_id[:8],
+                        "timestamp": now_iso(),
+                        "validator": "feedback_enforcement_engine"
+                    }
+                },
+                "timestamp": now_iso()
+            }
+        else:
+            response = {
+                "status": "feedback_blocked",
+                "trace_id": feedback_trace_id,
+                "message": "Feedback blocked by enforcement policy",
+                "feedback_details": {
+                    "original_trace_id": trace_id,
+                    "rating": rating,
+                    "feedback_type": feedback_type
                 },
                 "enforcement_metadata": {
-                    "status": "enforcement_approved",
-                    "rule_id": "NYAYA_INTEGRATION_RULE_001",
-                    "decision": "ALLOW",
-                    "reasoning": "Query processed with real legal data from jurisdiction databases",
+                    "status": "enforcement_blocked",
+                    "rule_id": "FEEDBACK_RULE_001",
+                    "decision": "BLOCK",
+                    "reasoning": "Feedback submission blocked by enforcement policy",
                     "signed_proof": {
-                        "hash": "nyaya_proof_" + trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "validator": "nyaya_enforcement_engine"
-                    },
-                    "processing_mode": "sovereign_compliant_data_driven"
+                        "hash": "feedback_blocked_" + feedback_trace_id[:8],
+                        "timestamp": now_iso(),
+                        "validator": "feedback_enforcement_engine"
+                    }
                 },
-                "message": legal_response["message"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
-            
-            self.send_json_response(response, 200)
-            
-        except Exception as e:
-            logger.error(f"Error processing Nyaya query: {e}")
-            logger.error(traceback.format_exc())
-            
+        
+        self.send_json_response(response, 200)
+    
+    def handle_explain_reasoning(self, request_data, path, raw_body=None):
+        """Handle reasoning explanation request"""
+        trace_id = request_data.get('trace_id', '').strip()
+        explanation_level = request_data.get('explanation_level', 'brief').strip().lower()
+        
+        # Validate required fields
+        if not trace_id or len(trace_id) < 5:
             response = {
-                "trace_id": str(uuid.uuid4()),
-                "status": "error",
-                "error": "Internal server error occurred while processing query",
-                "message": "An error occurred while retrieving legal information",
-                "timestamp": datetime.utcnow().isoformat()
+                "status": "validation_error",
+                "error": "Invalid trace_id provided",
+                "message": "Validation failed: trace_id is required and must be at least 5 characters",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
-            self.send_json_response(response, 500)
+            self.send_json_response(response, 400)
             return
-    
-    def do_POST(self):
-        """Handle POST requests with comprehensive error handling and approval system"""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
         
-        try:
-            # Get content length and read body
-            content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length).decode('utf-8') if content_length > 0 else ""
-            
-            # For webhook endpoints, validate signature
-            if path.startswith('/webhook'):
-                webhook_secret = self.safe_get_env('WEBHOOK_SECRET', 'dev-secret')
-                if not self.validate_signature(self.headers, post_data, webhook_secret):
-                    logger.warning("Webhook signature validation failed")
-                    response = {
-                        "status": "signature_invalid",
-                        "error": "Invalid webhook signature",
-                        "message": "Webhook signature validation failed",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 403)
-                    return
-            
-            # Parse JSON if possible
-            request_data = {}
-            if post_data.strip():
-                try:
-                    request_data = json.loads(post_data)
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON received, treating as raw data")
-                    request_data = {"raw_body": post_data, "error": "invalid_json", "trace_id": str(uuid.uuid4())}
-            
-            # Route to appropriate handler
-            if path == '/api/legal/query':
-                # This will be wrapped by the requires_approval decorator
-                self.handle_legal_query(request_data, path)
-                
-            elif path == '/nyaya/query':
-                # Handle Nyaya-specific query
-                self.handle_nyaya_query(request_data, path)
-                
-            elif path == '/nyaya/multi_jurisdiction':
-                # Handle multi-jurisdiction query
-                query = request_data.get('query', '').strip()
-                jurisdictions = request_data.get('jurisdictions', [])
-                
-                if not query:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Query field is required",
-                        "message": "Validation failed: query field is required",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                if not jurisdictions:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Jurisdictions field is required",
-                        "message": "Validation failed: jurisdictions field is required",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                # Process multi-jurisdiction query
-                trace_id = str(uuid.uuid4())
-                comparative_analysis = {}
-                for jurisdiction in jurisdictions[:3]:  # Limit to first 3 for performance
-                    comparative_analysis[jurisdiction] = {
-                        "jurisdiction": jurisdiction,
-                        "confidence": 0.82,
-                        "analysis": f"Analysis for {jurisdiction} jurisdiction completed",
-                        "legal_route": ["MULTI_JURISDICTION_ROUTE"],
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                
-                response = {
-                    "trace_id": trace_id,
-                    "status": "multi_jurisdiction_processed",
-                    "confidence": 0.85,
-                    "comparative_analysis": comparative_analysis,
-                    "enforcement_metadata": {
-                        "status": "enforcement_approved",
-                        "rule_id": "MULTI_JURISDICTION_RULE_001",
-                        "decision": "ALLOW",
-                        "reasoning": "Multi-jurisdiction query processed successfully",
-                        "signed_proof": {
-                            "hash": "multi_proof_" + trace_id[:8],
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "validator": "multi_jurisdiction_engine"
-                        }
-                    },
-                    "message": f"Multi-jurisdiction analysis completed for {len(comparative_analysis)} jurisdictions",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                self.send_json_response(response, 200)
-                
-            elif path == '/nyaya/feedback':
-                # Handle feedback submission with approval system
-                trace_id = request_data.get('trace_id', '').strip()
-                rating = request_data.get('rating')
-                feedback_type = request_data.get('feedback_type', '').strip()
-                comment = request_data.get('comment', '').strip()
-                
-                # Validate required fields
-                if not trace_id or len(trace_id) < 5:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Invalid trace_id provided",
-                        "message": "Validation failed: trace_id is required and must be at least 5 characters",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                if rating is None or not isinstance(rating, int) or rating < 1 or rating > 5:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Invalid rating provided",
-                        "message": "Validation failed: rating must be an integer between 1 and 5",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                valid_feedback_types = ['clarity', 'correctness', 'usefulness']
-                if not feedback_type or feedback_type not in valid_feedback_types:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Invalid feedback_type provided",
-                        "message": f"Validation failed: feedback_type must be one of {valid_feedback_types}",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                # Process feedback with enforcement check
-                feedback_trace_id = str(uuid.uuid4())
-                user_feedback = "positive" if rating >= 4 else "negative" if rating <= 2 else "neutral"
-                
-                # Simulate enforcement check (would integrate with real enforcement engine)
-                enforcement_permitted = True  # In real implementation, this would check enforcement policies
-                
-                if enforcement_permitted:
-                    response = {
-                        "status": "feedback_recorded",
-                        "trace_id": feedback_trace_id,
-                        "message": "Feedback recorded successfully",
-                        "feedback_details": {
-                            "original_trace_id": trace_id,
-                            "rating": rating,
-                            "feedback_type": feedback_type,
-                            "comment_length": len(comment) if comment else 0,
-                            "user_feedback_classification": user_feedback
-                        },
-                        "enforcement_metadata": {
-                            "status": "enforcement_approved",
-                            "rule_id": "FEEDBACK_RULE_001",
-                            "decision": "ALLOW",
-                            "reasoning": "Feedback submission permitted by enforcement policy",
-                            "signed_proof": {
-                                "hash": "feedback_proof_" + feedback_trace_id[:8],
-                                "timestamp": datetime.utcnow().isoformat(),
-                                "validator": "feedback_enforcement_engine"
-                            }
-                        },
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                else:
-                    response = {
-                        "status": "feedback_blocked",
-                        "trace_id": feedback_trace_id,
-                        "message": "Feedback blocked by enforcement policy",
-                        "feedback_details": {
-                            "original_trace_id": trace_id,
-                            "rating": rating,
-                            "feedback_type": feedback_type
-                        },
-                        "enforcement_metadata": {
-                            "status": "enforcement_blocked",
-                            "rule_id": "FEEDBACK_RULE_001",
-                            "decision": "BLOCK",
-                            "reasoning": "Feedback submission blocked by enforcement policy",
-                            "signed_proof": {
-                                "hash": "feedback_blocked_" + feedback_trace_id[:8],
-                                "timestamp": datetime.utcnow().isoformat(),
-                                "validator": "feedback_enforcement_engine"
-                            }
-                        },
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                
-                self.send_json_response(response, 200)
-                
-            elif path == '/nyaya/explain_reasoning':
-                # Handle reasoning explanation request
-                trace_id = request_data.get('trace_id', '').strip()
-                explanation_level = request_data.get('explanation_level', 'brief').strip().lower()
-                
-                # Validate required fields
-                if not trace_id or len(trace_id) < 5:
-                    response = {
-                        "status": "validation_error",
-                        "error": "Invalid trace_id provided",
-                        "message": "Validation failed: trace_id is required and must be at least 5 characters",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "trace_id": str(uuid.uuid4())
-                    }
-                    self.send_json_response(response, 400)
-                    return
-                
-                valid_levels = ['brief', 'detailed', 'constitutional']
-                if explanation_level not in valid_levels:
-                    explanation_level = 'brief'  # Default to brief if invalid
-                
-                # Simulate reasoning explanation (would retrieve from actual trace in real implementation)
-                explanation_trace_id = str(uuid.uuid4())
-                
-                # Generate appropriate explanation based on level
-                if explanation_level == 'brief':
-                    explanation = {
-                        "summary": "Query processed successfully through jurisdiction routing",
-                        "confidence": 0.85,
-                        "key_steps": ["Query received", "Jurisdiction identified", "Legal analysis performed", "Response generated"],
-                        "processing_time": "0.45 seconds"
-                    }
-                    reasoning_tree = {
-                        "root": "query_processing",
-                        "children": [
-                            {"step": "jurisdiction_routing", "confidence": 0.9},
-                            {"step": "legal_analysis", "confidence": 0.85}
-                        ]
-                    }
-                elif explanation_level == 'detailed':
-                    explanation = {
-                        "query_analysis": {
-                            "original_query": "Sample legal query",
-                            "identified_domain": "CIVIL",
-                            "target_jurisdiction": "IN",
-                            "confidence_factors": ["query_clarity", "domain_match", "jurisdiction_availability"]
-                        },
-                        "processing_details": {
-                            "agents_involved": ["jurisdiction_router", "legal_agent_IN"],
-                            "execution_steps": 4,
-                            "total_processing_time": "0.45 seconds",
-                            "resource_utilization": "low"
-                        },
-                        "decision_rationale": {
-                            "jurisdiction_selection": "Based on domain_hint and query content",
-                            "confidence_calculation": "Weighted average of routing and analysis confidence",
-                            "alternative_considerations": ["UK jurisdiction also considered but lower confidence"]
-                        }
-                    }
-                    reasoning_tree = {
-                        "root": {
-                            "step": "query_processing",
-                            "details": "Initial query processing and validation"
-                        },
-                        "routing": {
-                            "step": "jurisdiction_routing",
-                            "confidence": 0.9,
-                            "details": "Identified India as primary jurisdiction"
-                        },
-                        "analysis": {
-                            "step": "legal_analysis",
-                            "confidence": 0.85,
-                            "details": "Performed civil law analysis for property rights"
-                        },
-                        "response": {
-                            "step": "response_generation",
-                            "confidence": 0.95,
-                            "details": "Generated comprehensive legal guidance"
-                        }
-                    }
-                else:  # constitutional
-                    explanation = {
-                        "constitutional_basis": {
-                            "relevant_articles": ["Article 14", "Article 19", "Article 21"],
-                            "fundamental_rights_impact": "Right to property and equality before law",
-                            "constitutional_principles_applied": ["Natural justice", "Due process", "Legal certainty"]
-                        },
-                        "jurisdictional_constitutional_framework": {
-                            "applicable_constitution": "Constitution of India",
-                            "constitutional_courts": ["Supreme Court", "High Courts"],
-                            "constitutional_remedies": ["Writ petitions", "Constitutional appeals"]
-                        },
-                        "sovereign_compliance": {
-                            "constitutional_sovereignty": "Maintained throughout processing",
-                            "fundamental_duty_alignment": "Aligned with citizen welfare duties",
-                            "constitutional_values_preserved": ["Justice", "Liberty", "Equality", "Fraternity"]
-                        }
-                    }
-                    reasoning_tree = {
-                        "constitutional_root": {
-                            "step": "constitutional_analysis",
-                            "constitutional_articles": ["Article 14", "Article 19", "Article 21"],
-                            "fundamental_rights": ["Right to Property", "Equality before Law"]
-                        },
-                        "jurisdictional_compliance": {
-                            "step": "sovereign_compliance_check",
-                            "constitutional_alignment": "Full alignment achieved",
-                            "sovereign_principles": ["Justice", "Liberty", "Equality"]
-                        }
-                    }
-                
-                response = {
-                    "trace_id": explanation_trace_id,
-                    "status": "explanation_generated",
-                    "explanation_level": explanation_level,
-                    "target_trace_id": trace_id,
-                    "explanation": explanation,
-                    "reasoning_tree": reasoning_tree,
-                    "constitutional_articles": ["Article 14", "Article 19", "Article 21"] if explanation_level == 'constitutional' else [],
-                    "enforcement_metadata": {
-                        "status": "explanation_approved",
-                        "rule_id": "EXPLANATION_RULE_001",
-                        "decision": "ALLOW",
-                        "reasoning": "Reasoning explanation permitted for trace access",
-                        "signed_proof": {
-                            "hash": "explanation_proof_" + explanation_trace_id[:8],
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "validator": "explanation_engine"
-                        }
-                    },
-                    "message": f"Detailed reasoning explanation generated at {explanation_level} level",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                self.send_json_response(response, 200)
-                
-            else:
-                # For any unknown POST path, return 200 with helpful message
-                response = {
-                    "status": "endpoint_not_found",
-                    "requested_path": path,
-                    "message": "Unknown endpoint, but request processed successfully",
-                    "received_data_keys": list(request_data.keys()) if isinstance(request_data, dict) else [],
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "trace_id": str(uuid.uuid4())
+        if explanation_level not in REASONING_EXPLANATIONS:
+            explanation_level = 'brief'  # Default to brief if invalid
+        
+        # Simulate reasoning explanation (would retrieve from actual trace in real implementation)
+        explanation_trace_id = uuid.uuid4().hex
+        
+        # Look up the explanation for the requested level
+        explanation, reasoning_tree = REASONING_EXPLANATIONS[explanation_level]
+        
+        response = {
+            "trace_id": explanation_trace_id,
+            "status": "explanation_generated",
+            "explanation_level": explanation_level,
+            "target_trace_id": trace_id,
+            "explanation": explanation,
+            "reasoning_tree": reasoning_tree,
+            "constitutional_articles": ["Article 14", "Article 19", "Article 21"] if explanation_level == 'constitutional' else [],
+            "enforcement_metadata": {
+                "status": "explanation_approved",
+                "rule_id": "EXPLANATION_RULE_001",
+                "decision": "ALLOW",
+                "reasoning": "Reasoning explanation permitted for trace access",
+                "signed_proof": {
+                    "hash": "explanation_proof_" + explanation_trace_id[:8],
+                    "timestamp": now_iso(),
+                    "validator": "explanation_engine"
                 }
-                self.send_json_response(response, 200)
-                
-        except Exception as e:
-            logger.error(f"POST error: {e}")
-            logger.error(traceback.format_exc())
-            # Never return 500 - return error info as 200
-            response = {
-                "status": "post_error_handled",
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "message": "POST request error handled gracefully",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
-            }
-            self.send_json_response(response, 200)
+            },
+            "message": f"Detailed reasoning explanation generated at {explanation_level} level",
+            "timestamp": now_iso()
+        }
+        self.send_json_response(response, 200)
+    
+    def handle_unknown_post(self, request_data, path, raw_body=None):
+        """For any unknown POST path, return 200 with helpful message"""
+        response = {
+            "status": "endpoint_not_found",
+            "requested_path": path,
+            "message": "Unknown endpoint, but request processed successfully",
+            "received_data_keys": list(request_data.keys()) if isinstance(request_data, dict) else [],
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+        self.send_json_response(response, 200)
+    
+    # Route tables for do_GET/do_POST
+    GET_ROUTES = {
+        '/': handle_root,
+        '/health': handle_health,
+        '/debug/info': handle_debug_info,
+        '/debug/nonce-state': handle_nonce_state,
+        '/debug/test-nonce': handle_test_nonce,
+        '/debug/generate-nonce': handle_generate_nonce,
+        '/docs': handle_docs,
+    }
+    GET_PREFIX_ROUTES = (
+        ('/webhook', handle_webhook_get),
+        ('/nyaya/trace/', handle_trace),
+    )
+    POST_ROUTES = {
+        '/api/legal/query': handle_legal_query,
+        '/nyaya/query': handle_nyaya_query,
+        '/nyaya/multi_jurisdiction': handle_multi_jurisdiction,
+        '/nyaya/feedback': handle_feedback,
+        '/nyaya/explain_reasoning': handle_explain_reasoning,
+    }
 
 def create_fastapi_app():
     """Create FastAPI app with interactive documentation"""
@@ -1125,7 +1547,8 @@ def create_fastapi_app():
         description="Sovereign-compliant API for multi-agent legal intelligence",
         version="6.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
     )
     
     # Add CORS middleware
@@ -1174,15 +1597,15 @@ def create_fastapi_app():
                 "signature_validation": "ready",
                 "rate_limiting": "active"
             },
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": str(uuid.uuid4())
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
         }
     
     @app.get("/health")
     async def health_check():
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso(),
             "service": "Nyaya Integrated Backend",
             "version": "6.0.0",
             "components": {
@@ -1194,7 +1617,7 @@ def create_fastapi_app():
             },
             "message": "All systems healthy with comprehensive error handling",
             "repositories_integrated": 3,
-            "trace_id": str(uuid.uuid4())
+            "trace_id": uuid.uuid4().hex
         }
     
     @app.get("/docs")
@@ -1244,8 +1667,8 @@ def create_fastapi_app():
                 "signature_validation": "Available for webhook endpoints",
                 "rate_limiting": "Active"
             },
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": str(uuid.uuid4())
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
         }
     
     @app.get("/debug/nonce-state")
@@ -1260,41 +1683,37 @@ def create_fastapi_app():
             "ttl_seconds": 300,
             "instance_id": "debug_nonce_manager_12345",
             "message": "Nonce manager state information (simulated for debug purposes)",
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": str(uuid.uuid4())
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
         }
         return response
     
     @app.get("/debug/generate-nonce")
     async def debug_generate_nonce():
         """Endpoint to generate a valid nonce for testing"""
-        nonce = "test_nonce_" + str(uuid.uuid4())[:12]
+        nonce = "test_nonce_" + uuid.uuid4().hex[:12]
         
         response = {
             "status": "nonce_generated",
             "nonce": nonce,
             "message": "Use this nonce in your next API request",
             "expires_in_seconds": 300,
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": str(uuid.uuid4())
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
         }
         return response
     
     @app.get("/debug/info")
     async def debug_info():
-        return {
-            "python_version": sys.version,
-            "working_directory": os.getcwd(),
-            "environment_variables": {
-                "PORT": os.environ.get("PORT", "not_set"),
-                "PYTHON_VERSION": os.environ.get("PYTHON_VERSION", "not_set"),
-                "API_KEY_SET": bool(os.environ.get("API_KEY"))
-            },
-            "python_path": sys.path[:3],
-            "timestamp": datetime.utcnow().isoformat(),
-            "status": "debug_info_available",
-            "trace_id": str(uuid.uuid4())
-        }
+        # Shares the memoized pre-serialized body with the basic HTTP server
+        template = debug_info_template(
+            os.getcwd(),
+            tuple(sys.path[:3]),
+            os.environ.get("PORT", "not_set"),
+            os.environ.get("PYTHON_VERSION", "not_set"),
+            bool(os.environ.get("API_KEY"))
+        )
+        return Response(content=fill_response_template(template), media_type="application/json")
     
     @app.get("/nyaya/trace/{trace_id}")
     async def get_trace(trace_id: str):
@@ -1303,8 +1722,8 @@ def create_fastapi_app():
                 "status": "trace_not_found",
                 "error": "Invalid trace_id",
                 "message": "Trace ID must be at least 5 characters long",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             }
         
         return {
@@ -1313,66 +1732,99 @@ def create_fastapi_app():
             "provenance_chain": [
                 {
                     "step": "RECEIVED_QUERY",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                     "component": "API_Gateway",
                     "details": "Query received and validated"
                 },
                 {
                     "step": "ROUTED_TO_AGENT",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                     "component": "JurisdictionRouter",
                     "details": "Query routed to appropriate legal agent"
                 },
                 {
                     "step": "AGENT_PROCESSED",
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                     "component": "LegalAgent",
                     "details": "Legal analysis completed"
                 }
             ],
             "message": "Full sovereign audit trail retrieved",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
     
     # POST endpoints would need to be added here as well...
     
-    from fastapi import HTTPException
-    from pydantic import BaseModel
-    from typing import Optional
-    import asyncio
-    
     # Legal data loader already available globally
     
-    class QueryRequest(BaseModel):
-        query: str
-        jurisdiction_hint: str = None
-        domain_hint: str = None
+    # Request models are msgspec Structs when msgspec is installed (decoded and
+    # validated in C straight from the raw body), Pydantic models otherwise
+    RequestModel = msgspec.Struct if MSGSPEC_AVAILABLE else BaseModel
+    request_errors = (msgspec.DecodeError,) if MSGSPEC_AVAILABLE else (ValidationError,)
     
-    class MultiJurisdictionRequest(BaseModel):
+    class QueryRequest(RequestModel):
         query: str
-        jurisdictions: list
+        jurisdiction_hint: Optional[str] = None
+        domain_hint: Optional[str] = None
     
-    class FeedbackRequest(BaseModel):
+    class MultiJurisdictionRequest(RequestModel):
+        # Either a single query with its jurisdictions, or a batch of such
+        # objects in queries
+        query: Optional[str] = None
+        jurisdictions: Optional[list] = None
+        # Left untyped so a malformed batch gets the same 400 as the basic server
+        queries: Any = None
+    
+    class FeedbackRequest(RequestModel):
         trace_id: str
         rating: int
         feedback_type: str
         comment: Optional[str] = None
     
-    class ExplainReasoningRequest(BaseModel):
+    class ExplainReasoningRequest(RequestModel):
         trace_id: str
         explanation_level: str = "brief"
     
-    @app.post("/api/legal/query")
-    async def legal_query(request: QueryRequest):
+    async def parse_request(http_request: Request, model):
+        """Decode the raw JSON body into a request model, bypassing FastAPI's Pydantic body parsing"""
+        body = await http_request.body()
+        try:
+            if MSGSPEC_AVAILABLE:
+                # strict=False accepts numeric strings for number fields
+                # ("5" -> 5) like Pydantic, but unlike Pydantic v1 it does not
+                # turn numbers into strings: {"query": 5} is rejected with 422
+                return msgspec.json.decode(body, type=model, strict=False)
+            return model.parse_raw(body)
+        except request_errors as e:
+            # Same detail shape as FastAPI's own request validation errors
+            if MSGSPEC_AVAILABLE:
+                detail = [{"loc": ["body"], "msg": str(e), "type": "value_error"}]
+            else:
+                detail = [{**error, "loc": ["body", *error["loc"]]} for error in e.errors()]
+            raise HTTPException(status_code=422, detail=detail)
+    
+    def request_body_spec(model):
+        """OpenAPI requestBody for a route whose body is decoded by parse_request"""
+        # The routes take a bare Request, so FastAPI cannot infer the body
+        # schema for /docs and /openapi.json on its own
+        if MSGSPEC_AVAILABLE:
+            schema = msgspec.json.schema_components([model])[1][model.__name__]
+        else:
+            schema = model.schema()
+        return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+    
+    @app.post("/api/legal/query", openapi_extra=request_body_spec(QueryRequest))
+    async def legal_query(http_request: Request):
         """Process legal queries with jurisdiction routing and real data fetching"""
+        request = await parse_request(http_request, QueryRequest)
         # Check if legal data loader is available
         if legal_data_loader is None:
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": uuid.uuid4().hex,
                 "status": "error",
                 "error": "Legal data loader not available",
                 "message": "Legal data loader is not available for processing queries",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         
         # Validate query
@@ -1381,12 +1833,12 @@ def create_fastapi_app():
                 "status": "validation_error",
                 "error": "Query must be at least 3 characters long",
                 "message": "Validation failed: query too short",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         # Process the legal query with real data
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         
         try:
             # Detect jurisdiction and classify domain
@@ -1438,40 +1890,40 @@ def create_fastapi_app():
                     "reasoning": "Legal query processed with real data from jurisdiction databases",
                     "signed_proof": {
                         "hash": "integrated_proof_" + trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "integrated_system"
                     },
                     "processing_mode": "data_driven_backend"
                 },
                 "message": legal_response["message"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             
             return response
         
         except Exception as e:
-            logger.error(f"Error processing legal query: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error processing legal query: %s", e)
             
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": trace_id,
                 "status": "error",
                 "error": "Internal server error occurred while processing query",
                 "message": "An error occurred while retrieving legal information",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
     
-    @app.post("/nyaya/query")
-    async def nyaya_query(request: QueryRequest):
+    @app.post("/nyaya/query", openapi_extra=request_body_spec(QueryRequest))
+    async def nyaya_query(http_request: Request):
         """Handle Nyaya-specific legal query with advanced features and real data"""
+        request = await parse_request(http_request, QueryRequest)
         # Check if legal data loader is available
         if legal_data_loader is None:
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": uuid.uuid4().hex,
                 "status": "error",
                 "error": "Legal data loader not available",
                 "message": "Legal data loader is not available for processing queries",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         
         # Validate query
@@ -1480,12 +1932,12 @@ def create_fastapi_app():
                 "status": "validation_error",
                 "error": "Query must be at least 3 characters long",
                 "message": "Validation failed: query too short",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         # Process the Nyaya query with real data
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         
         try:
             # Detect jurisdiction and classify domain
@@ -1533,25 +1985,25 @@ def create_fastapi_app():
                 "provenance_chain": [
                     {
                         "step": "QUERY_RECEIVED",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "API_GATEWAY",
                         "details": "Query received and validated"
                     },
                     {
                         "step": "JURISDICTION_DETECTION",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "DOMAIN_CLASSIFIER",
                         "details": f"Detected jurisdiction: {jurisdiction}"
                     },
                     {
                         "step": "LEGAL_DATA_FETCH",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "LEGAL_DATABASE",
                         "details": f"Retrieved {len(legal_data) if legal_data else 0} legal provisions"
                     },
                     {
                         "step": "APPROVAL_CHECK",
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "component": "APPROVAL_SYSTEM",
                         "details": "Safety and enforcement approval passed"
                     }
@@ -1560,7 +2012,7 @@ def create_fastapi_app():
                     "jurisdiction_rationale": f"Based on query content and {jurisdiction} legal framework",
                     "domain_classification": f"{domain}/{subdomain} with confidence {domain_confidence:.2f}",
                     "data_sources": [f"{jurisdiction.lower()}_law_dataset.json"],
-                    "confidence_factors": ["query_specificity", "data_availability", "jurisdiction_matching"]
+                    "confidence_factors": NYAYA_CONFIDENCE_FACTORS
                 },
                 "enforcement_metadata": {
                     "status": "enforcement_approved",
@@ -1569,50 +2021,174 @@ def create_fastapi_app():
                     "reasoning": "Query processed with real legal data from jurisdiction databases",
                     "signed_proof": {
                         "hash": "nyaya_proof_" + trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "nyaya_enforcement_engine"
                     },
                     "processing_mode": "sovereign_compliant_data_driven"
                 },
                 "message": legal_response["message"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             
             return response
         
         except Exception as e:
-            logger.error(f"Error processing Nyaya query: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error processing Nyaya query: %s", e)
+            
+            return {
+                "trace_id": trace_id,
+                "status": "error",
+                "error": "Internal server error occurred while processing query",
+                "message": "An error occurred while retrieving legal information",
+                "timestamp": now_iso()
+            }
+    
+    def analyze_jurisdiction(query, jurisdiction):
+        """Run classification, search and formatting for one jurisdiction of a multi-jurisdiction query"""
+        # Get domain classification for this jurisdiction
+        domain, subdomain, domain_confidence = legal_data_loader.classify_domain(query, jurisdiction)
+        
+        # Search for relevant legal data
+        legal_data = legal_data_loader.search_law_data(query, jurisdiction, domain, subdomain)
+        
+        # Format response with real legal data
+        legal_response = legal_data_loader.format_response(
+            query, jurisdiction, domain, subdomain, legal_data, domain_confidence
+        )
+        
+        return {
+            "jurisdiction": jurisdiction,
+            "domain": domain,
+            "subdomain": subdomain,
+            "confidence": legal_response["confidence"],
+            "legal_guidance": legal_response.get("legal_guidance", []),
+            "citations": legal_response.get("citations", []),
+            "analysis": f"Analysis for {jurisdiction} jurisdiction completed with {len(legal_data) if legal_data else 0} legal provisions",
+            "legal_route": ["MULTI_JURISDICTION_ROUTE"],
+            "timestamp": now_iso()
+        }
+    
+    async def compare_jurisdictions(query, jurisdictions):
+        """Analyse a query in each jurisdiction, keyed by jurisdiction"""
+        # Jurisdictions are independent, so they are analysed concurrently
+        # on the default thread pool instead of blocking the event loop
+        # one after another
+        jurisdictions = jurisdictions[:3]  # Limit to first 3 for performance
+        loop = asyncio.get_running_loop()
+        analyses = await asyncio.gather(*[
+            loop.run_in_executor(None, analyze_jurisdiction, query, jurisdiction)
+            for jurisdiction in jurisdictions
+        ])
+        return dict(zip(jurisdictions, analyses))
+    
+    async def multi_jurisdiction_batch(http_request, queries):
+        """Handle a batch of multi-jurisdiction queries in one response"""
+        # Safety approval runs once on the whole envelope
+        body = await http_request.body()
+        safety_approved, safety_msg = ApprovalSystem.is_safety_approved(loads_json(body), body)
+        if not safety_approved:
+            logger.warning("Safety approval failed: %s", safety_msg)
+            raise HTTPException(status_code=403, detail={
+                "status": "safety_rejected",
+                "error": safety_msg,
+                "message": "Request rejected by safety approval system",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            })
+        
+        invalid = check_batch_queries(queries)
+        if invalid:
+            error, message = invalid
+            raise HTTPException(status_code=400, detail={
+                "status": "validation_error",
+                "error": error,
+                "message": message,
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            })
+        
+        # One trace_id and envelope for the whole batch; invalid entries are
+        # reported in place instead of failing the other queries
+        trace_id = uuid.uuid4().hex
+        
+        try:
+            entries = [parse_batch_query(item) for item in queries]
+            analyses = iter(await asyncio.gather(*[
+                compare_jurisdictions(query, jurisdictions)
+                for query, jurisdictions, error in entries if not error
+            ]))
+            results = []
+            for query, jurisdictions, error in entries:
+                if error:
+                    results.append({
+                        "query": query,
+                        "status": "validation_error",
+                        "error": error
+                    })
+                    continue
+                results.append({
+                    "query": query,
+                    "status": "multi_jurisdiction_processed",
+                    "confidence": 0.85,
+                    "comparative_analysis": next(analyses)
+                })
+            
+            return {
+                "trace_id": trace_id,
+                "status": "multi_jurisdiction_batch_processed",
+                "results": results,
+                "enforcement_metadata": {
+                    "status": "enforcement_approved",
+                    "rule_id": "MULTI_JURISDICTION_RULE_001",
+                    "decision": "ALLOW",
+                    "reasoning": "Multi-jurisdiction batch processed with real legal data from multiple jurisdiction databases",
+                    "signed_proof": {
+                        "hash": "multi_proof_" + trace_id[:8],
+                        "timestamp": now_iso(),
+                        "validator": "multi_jurisdiction_engine"
+                    }
+                },
+                "message": f"Multi-jurisdiction analysis completed for {len(results)} queries with real legal data",
+                "timestamp": now_iso()
+            }
+        
+        except Exception as e:
+            logger.exception("Error processing multi-jurisdiction batch: %s", e)
             
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": trace_id,
                 "status": "error",
                 "error": "Internal server error occurred while processing query",
                 "message": "An error occurred while retrieving legal information",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
     
-    @app.post("/nyaya/multi_jurisdiction")
-    async def multi_jurisdiction_query(request: MultiJurisdictionRequest):
+    @app.post("/nyaya/multi_jurisdiction", openapi_extra=request_body_spec(MultiJurisdictionRequest))
+    async def multi_jurisdiction_query(http_request: Request):
         """Handle multi-jurisdiction query with real data from multiple jurisdictions"""
+        request = await parse_request(http_request, MultiJurisdictionRequest)
         # Check if legal data loader is available
         if legal_data_loader is None:
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": uuid.uuid4().hex,
                 "status": "error",
                 "error": "Legal data loader not available",
                 "message": "Legal data loader is not available for processing queries",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         
+        # Several queries can be batched into one request
+        if request.queries is not None:
+            return await multi_jurisdiction_batch(http_request, request.queries)
+        
         # Validate required fields
         if not request.query or len(request.query.strip()) < 3:
             raise HTTPException(status_code=400, detail={
                 "status": "validation_error",
                 "error": "Query must be at least 3 characters long",
                 "message": "Validation failed: query too short",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         if not request.jurisdictions or len(request.jurisdictions) == 0:
@@ -1620,39 +2196,15 @@ def create_fastapi_app():
                 "status": "validation_error",
                 "error": "Jurisdictions field is required",
                 "message": "Validation failed: jurisdictions field is required",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         # Process multi-jurisdiction query with real data
-        trace_id = str(uuid.uuid4())
+        trace_id = uuid.uuid4().hex
         
         try:
-            comparative_analysis = {}
-            
-            for jurisdiction in request.jurisdictions[:3]:  # Limit to first 3 for performance
-                # Get domain classification for this jurisdiction
-                domain, subdomain, domain_confidence = legal_data_loader.classify_domain(request.query, jurisdiction)
-                
-                # Search for relevant legal data
-                legal_data = legal_data_loader.search_law_data(request.query, jurisdiction, domain, subdomain)
-                
-                # Format response with real legal data
-                legal_response = legal_data_loader.format_response(
-                    request.query, jurisdiction, domain, subdomain, legal_data, domain_confidence
-                )
-                
-                comparative_analysis[jurisdiction] = {
-                    "jurisdiction": jurisdiction,
-                    "domain": domain,
-                    "subdomain": subdomain,
-                    "confidence": legal_response["confidence"],
-                    "legal_guidance": legal_response.get("legal_guidance", []),
-                    "citations": legal_response.get("citations", []),
-                    "analysis": f"Analysis for {jurisdiction} jurisdiction completed with {len(legal_data) if legal_data else 0} legal provisions",
-                    "legal_route": ["MULTI_JURISDICTION_ROUTE"],
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+            comparative_analysis = await compare_jurisdictions(request.query, request.jurisdictions)
             
             response = {
                 "trace_id": trace_id,
@@ -1666,38 +2218,38 @@ def create_fastapi_app():
                     "reasoning": "Multi-jurisdiction query processed with real legal data from multiple jurisdiction databases",
                     "signed_proof": {
                         "hash": "multi_proof_" + trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "multi_jurisdiction_engine"
                     }
                 },
                 "message": f"Multi-jurisdiction analysis completed for {len(comparative_analysis)} jurisdictions with real legal data",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
             return response
         
         except Exception as e:
-            logger.error(f"Error processing multi-jurisdiction query: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error processing multi-jurisdiction query: %s", e)
             
             return {
-                "trace_id": str(uuid.uuid4()),
+                "trace_id": trace_id,
                 "status": "error",
                 "error": "Internal server error occurred while processing query",
                 "message": "An error occurred while retrieving legal information",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
     
-    @app.post("/nyaya/feedback")
-    async def submit_feedback(request: FeedbackRequest):
+    @app.post("/nyaya/feedback", openapi_extra=request_body_spec(FeedbackRequest))
+    async def submit_feedback(http_request: Request):
         """Submit system feedback with approval system"""
+        request = await parse_request(http_request, FeedbackRequest)
         # Validate required fields
         if not request.trace_id or len(request.trace_id.strip()) < 5:
             raise HTTPException(status_code=400, detail={
                 "status": "validation_error",
                 "error": "Invalid trace_id provided",
                 "message": "Validation failed: trace_id is required and must be at least 5 characters",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         if request.rating is None or request.rating < 1 or request.rating > 5:
@@ -1705,8 +2257,8 @@ def create_fastapi_app():
                 "status": "validation_error",
                 "error": "Invalid rating provided",
                 "message": "Validation failed: rating must be between 1 and 5",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         valid_feedback_types = ['clarity', 'correctness', 'usefulness']
@@ -1715,12 +2267,12 @@ def create_fastapi_app():
                 "status": "validation_error",
                 "error": "Invalid feedback_type provided",
                 "message": f"Validation failed: feedback_type must be one of {valid_feedback_types}",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         # Process feedback with enforcement check
-        feedback_trace_id = str(uuid.uuid4())
+        feedback_trace_id = uuid.uuid4().hex
         user_feedback = "positive" if request.rating >= 4 else "negative" if request.rating <= 2 else "neutral"
         
         # Simulate enforcement check
@@ -1745,11 +2297,11 @@ def create_fastapi_app():
                     "reasoning": "Feedback submission permitted by enforcement policy",
                     "signed_proof": {
                         "hash": "feedback_proof_" + feedback_trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "feedback_enforcement_engine"
                     }
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         else:
             response = {
@@ -1768,26 +2320,27 @@ def create_fastapi_app():
                     "reasoning": "Feedback submission blocked by enforcement policy",
                     "signed_proof": {
                         "hash": "feedback_blocked_" + feedback_trace_id[:8],
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": now_iso(),
                         "validator": "feedback_enforcement_engine"
                     }
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now_iso()
             }
         
         return response
     
-    @app.post("/nyaya/explain_reasoning")
-    async def explain_reasoning(request: ExplainReasoningRequest):
+    @app.post("/nyaya/explain_reasoning", openapi_extra=request_body_spec(ExplainReasoningRequest))
+    async def explain_reasoning(http_request: Request):
         """Get detailed reasoning explanation"""
+        request = await parse_request(http_request, ExplainReasoningRequest)
         # Validate required fields
         if not request.trace_id or len(request.trace_id.strip()) < 5:
             raise HTTPException(status_code=400, detail={
                 "status": "validation_error",
                 "error": "Invalid trace_id provided",
                 "message": "Validation failed: trace_id is required and must be at least 5 characters",
-                "timestamp": datetime.utcnow().isoformat(),
-                "trace_id": str(uuid.uuid4())
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
             })
         
         valid_levels = ['brief', 'detailed', 'constitutional']
@@ -1796,7 +2349,7 @@ def create_fastapi_app():
             explanation_level = 'brief'
         
         # Generate explanation
-        explanation_trace_id = str(uuid.uuid4())
+        explanation_trace_id = uuid.uuid4().hex
         
         if explanation_level == 'brief':
             explanation = {
@@ -1871,20 +2424,20 @@ def create_fastapi_app():
                 "reasoning": "Reasoning explanation permitted for trace access",
                 "signed_proof": {
                     "hash": "explanation_proof_" + explanation_trace_id[:8],
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": now_iso(),
                     "validator": "explanation_engine"
                 }
             },
             "message": f"Detailed reasoning explanation generated at {explanation_level} level",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso()
         }
         return response
     
+    @app.get("/debug/test-nonce")
     @app.post("/debug/test-nonce")
     async def test_nonce_generation():
         """Debug endpoint to test nonce generation and validation"""
-        import time
-        nonce = "debug_nonce_" + str(uuid.uuid4())[:8]
+        nonce = "debug_nonce_" + uuid.uuid4().hex[:8]
         
         response = {
             "status": "nonce_test_completed",
@@ -1895,13 +2448,111 @@ def create_fastapi_app():
             "current_time": time.time(),
             "instance_id": "debug_nonce_manager_12345",
             "message": "Nonce generation and validation test completed (simulated)",
-            "timestamp": datetime.utcnow().isoformat(),
-            "trace_id": str(uuid.uuid4())
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
         }
         return response
     
+    @app.get("/webhook")
+    @app.get("/webhook/{webhook_path:path}")
+    async def webhook_get(http_request: Request):
+        """Handle webhook verification challenge and webhook status"""
+        challenge = http_request.query_params.get('hub.challenge')
+        if challenge:
+            return PlainTextResponse(challenge)
+        
+        return {
+            "status": "webhook_endpoint",
+            "message": "Webhook endpoint ready for integration",
+            "capabilities": ["signature_validation", "challenge_verification", "secure_processing"],
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+    
+    @app.post("/webhook")
+    @app.post("/webhook/{webhook_path:path}")
+    async def webhook_post(http_request: Request):
+        """Validate the webhook signature, then acknowledge like any other unknown POST"""
+        body = await http_request.body()
+        webhook_secret = os.environ.get('WEBHOOK_SECRET', 'dev-secret')
+        if not IntegratedNyayaHandler.validate_signature(http_request.headers, body, webhook_secret):
+            logger.warning("Webhook signature validation failed")
+            return JSONResponse(status_code=403, content={
+                "status": "signature_invalid",
+                "error": "Invalid webhook signature",
+                "message": "Webhook signature validation failed",
+                "timestamp": now_iso(),
+                "trace_id": uuid.uuid4().hex
+            })
+        return await unknown_post(http_request)
+    
+    # Catch-alls are registered last so every route above takes precedence
+    @app.get("/{unknown_path:path}")
+    async def unknown_get(http_request: Request):
+        """For any unknown GET path, return 200 with helpful message"""
+        return {
+            "status": "endpoint_not_found",
+            "requested_path": http_request.url.path,
+            "available_endpoints": ["/", "/health", "/debug/info", "/webhook/*", "/nyaya/trace/{trace_id}"],
+            "message": "Unknown endpoint, returning 200 with available endpoints",
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+    
+    @app.post("/{unknown_path:path}")
+    async def unknown_post(http_request: Request):
+        """For any unknown POST path, return 200 with helpful message"""
+        body = await http_request.body()
+        request_data = {}
+        if body.strip():
+            try:
+                request_data = loads_json(body)
+            except ValueError:
+                logger.warning("Invalid JSON received, treating as raw data")
+                request_data = {"raw_body": body.decode('utf-8', 'replace'), "error": "invalid_json"}
+        
+        return {
+            "status": "endpoint_not_found",
+            "requested_path": http_request.url.path,
+            "message": "Unknown endpoint, but request processed successfully",
+            "received_data_keys": list(request_data.keys()) if isinstance(request_data, dict) else [],
+            "timestamp": now_iso(),
+            "trace_id": uuid.uuid4().hex
+        }
+    
     return app
 
+class BoundedHTTPServer(ThreadingHTTPServer):
+    """Thread-per-connection HTTP server with a cap on open connections"""
+    daemon_threads = True
+    
+    def __init__(self, server_address, handler_class, max_connections=None):
+        super().__init__(server_address, handler_class)
+        if max_connections is None:
+            max_connections = int(os.environ.get("HTTP_MAX_CONNECTIONS", 256))
+        # Every connection keeps its own thread, so a client holding an idle
+        # socket open only ever ties up that one connection (for at most the
+        # handler's idle timeout) and never the threads serving other clients
+        self.connection_slots = threading.BoundedSemaphore(max_connections)
+    
+    def process_request(self, request, client_address):
+        """Start a connection thread, or drop the connection when at the cap"""
+        if not self.connection_slots.acquire(blocking=False):
+            logger.warning("Connection limit reached, dropping connection from %s", client_address[0])
+            self.shutdown_request(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            self.connection_slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.connection_slots.release()
+
 def run_integrated_server(port=None):
     """Run the integrated server"""
     if port is None:
@@ -1909,35 +2560,41 @@ def run_integrated_server(port=None):
     
     # Try FastAPI first if available
     if FASTAPI_AVAILABLE:
-        logger.info(f"Starting integrated Nyaya server with FastAPI on port {port}")
+        logger.info("Starting integrated Nyaya server with FastAPI on port %d", port)
         logger.info("Server includes: approval system, signature validation, environment safety, integrated repos")
         
-        app = create_fastapi_app()
+        # uvicorn picks uvloop and httptools automatically when installed
+        # (uvicorn[standard]). Worker processes need the app as an import
+        # string, so they build it through the factory themselves.
+        workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+        app = create_fastapi_app() if workers == 1 else "integrated_nyaya_server:create_fastapi_app"
         if app:
             try:
-                uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+                if workers == 1:
+                    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+                else:
+                    uvicorn.run(app, factory=True, workers=workers, host="0.0.0.0", port=port, log_level="info")
                 return
             except Exception as e:
-                logger.warning(f"FastAPI server failed, falling back to basic HTTP: {e}")
+                logger.warning("FastAPI server failed, falling back to basic HTTP: %s", e)
     
     # Fallback to basic HTTP server
-    logger.info(f"Starting integrated Nyaya server on port {port}")
+    logger.info("Starting integrated Nyaya server on port %d", port)
     logger.info("Server includes: approval system, signature validation, environment safety, integrated repos")
     
     try:
-        httpd = HTTPServer(('0.0.0.0', port), IntegratedNyayaHandler)
-        logger.info(f"Integrated server listening on http://0.0.0.0:{port}")
+        httpd = BoundedHTTPServer(('0.0.0.0', port), IntegratedNyayaHandler)
+        logger.info("Integrated server listening on http://0.0.0.0:%d", port)
         httpd.serve_forever()
     except KeyboardInterrupt:
         logger.info("Integrated server shutting down...")
         httpd.shutdown()
     except Exception as e:
-        logger.error(f"Server error: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Server error: %s", e)
 
 if __name__ == "__main__":
     logger.info("Starting Nyaya Integrated Backend - ALL REPOSITORIES COMBINED")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Working directory: {os.getcwd()}")
+    logger.info("Python version: %s", sys.version)
+    logger.info("Working directory: %s", os.getcwd())
     
     run_integrated_server()
\ No newline at end of file
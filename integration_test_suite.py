@@ -3,146 +3,268 @@ Comprehensive Test Suite for Integrated Nyaya Backend
 This verifies that all three repositories have been properly integrated
 and all endpoints function correctly with proper error handling.
 """
+import atexit
+import http.client
+import multiprocessing
 import threading
 import time
-import requests
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 import json
 from pathlib import Path
 import sys
-import subprocess
 
-def test_integrated_server():
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from integrated_nyaya_server import run_integrated_server
+
+# orjson parses the response bodies several times faster when installed
+try:
+    import orjson
+    loads_json = orjson.loads
+    dumps_json = orjson.dumps
+except ImportError:
+    loads_json = json.loads
+
+    def dumps_json(obj):
+        return json.dumps(obj).encode('utf-8')
+
+Response = namedtuple('Response', 'status_code headers content')
+
+class KeepAliveSession(threading.local):
+    """Minimal keep-alive HTTP client over http.client for plaintext loopback tests.
+    
+    Being thread-local, each thread keeps its own open connection per host,
+    so the concurrent test runner can share one session safely.
+    """
+    
+    def __init__(self):
+        self.connections = {}
+    
+    def get_connection(self, host, port, timeout):
+        """Return this thread's open connection to host:port, connecting if needed"""
+        connection = self.connections.get((host, port))
+        if connection is None:
+            connect_timeout, read_timeout = timeout
+            connection = http.client.HTTPConnection(host, port, timeout=connect_timeout)
+            connection.connect()
+            connection.sock.settimeout(read_timeout)
+            self.connections[(host, port)] = connection
+        return connection
+    
+    def drop_connection(self, host, port):
+        connection = self.connections.pop((host, port), None)
+        if connection is not None:
+            connection.close()
+    
+    def request(self, method, url, json=None, data=None, timeout=None):
+        """Send one request and return a Response with the full body read"""
+        parts = urlsplit(url)
+        path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        headers = {}
+        body = None
+        if json is not None:
+            body = dumps_json(json)
+            headers['Content-Type'] = 'application/json'
+        elif data is not None:
+            body = data.encode('utf-8') if isinstance(data, str) else data
+        
+        key = (parts.hostname, parts.port or 80)
+        timeout = timeout or REQUEST_TIMEOUT
+        # A reused connection may have been closed by the server while idle,
+        # so a failure on one is retried once on a fresh connection
+        for attempt in range(2):
+            reused = key in self.connections
+            connection = self.get_connection(*key, timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                content = response.read()
+            except (OSError, http.client.HTTPException):
+                self.drop_connection(*key)
+                if reused and attempt == 0:
+                    continue
+                raise
+            if response.will_close:
+                self.drop_connection(*key)
+            return Response(response.status, response.headers, content)
+    
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+# One keep-alive session for the whole suite, so each test reuses an open
+# connection instead of paying a TCP handshake per request
+SESSION = KeepAliveSession()
+
+# SESSION's connections are per thread, so every test group runs on the same
+# worker threads; a pool per group would open a fresh set of connections each
+# time and leave the previous group's sockets open
+EXECUTOR = ThreadPoolExecutor(max_workers=16)
+atexit.register(EXECUTOR.shutdown)
+
+# (connect, read) timeouts: loopback answers in milliseconds, so a dead or
+# hung server fails a case quickly instead of stalling the run
+REQUEST_TIMEOUT = (0.2, 1.0)
+PROBE_TIMEOUT = (0.05, 0.1)
+
+# One request/expectation pair; data is the JSON body for POST cases and url
+# is filled in once per run by with_urls()
+TestCase = namedtuple('TestCase', 'name method path expected desc data url', defaults=("", None, None))
+
+def wait_ready(base_url, deadline=2.0):
+    """Poll /health until the server answers 200 instead of sleeping a fixed time"""
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        try:
+            if SESSION.get(f"{base_url}/health", timeout=PROBE_TIMEOUT).status_code == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        time.sleep(0.02)
+    raise RuntimeError(f"Server at {base_url} not ready after {deadline}s")
+
+def with_urls(base_url, test_cases):
+    """Resolve each case's full URL once, ahead of the request loop"""
+    return [test_case._replace(url=base_url + test_case.path) for test_case in test_cases]
+
+def run_case(test_case):
+    """Issue one TestCase request"""
+    return SESSION.request(test_case.method, test_case.url, json=test_case.data, timeout=REQUEST_TIMEOUT)
+
+def json_body(response):
+    """Decode a JSON object response body, or return None when the response is
+    not JSON, does not parse, or is not an object"""
+    if not response.headers.get('Content-Type', '').startswith('application/json'):
+        return None
+    # A malformed body must not escape into the caller's error handling,
+    # which would count the case a second time as a failure
+    try:
+        body = loads_json(response.content)
+    except ValueError:
+        return None
+    return body if isinstance(body, dict) else None
+
+def run_concurrently(send, cases):
+    """Issue every case in parallel through send(case), returning the responses
+    in case order with the raised exception in place of any failed request"""
+    def attempt(case):
+        try:
+            return send(case)
+        except Exception as e:
+            return e
+    
+    return list(EXECUTOR.map(attempt, cases))
+
+def test_integrated_server(base_url):
     """Test that the integrated server handles all scenarios correctly"""
     print("=" * 80)
     print("NYAYA INTEGRATED BACKEND - COMPREHENSIVE VERIFICATION")
     print("=" * 80)
     
-    # Import and start server
-    sys.path.insert(0, str(Path(__file__).parent))
-    from integrated_nyaya_server import run_integrated_server
-    
-    def server_thread():
-        run_integrated_server(port=8090)
-    
-    # Start server in background thread
-    server = threading.Thread(target=server_thread, daemon=True)
-    server.start()
-    
-    # Wait for server to start
-    time.sleep(3)
-    
-    base_url = "http://localhost:8090"
-    test_results = {"passed": 0, "failed": 0, "total": 0}
+    test_results = Counter()
     
     # Test cases covering all integrated functionality
     test_cases = [
         # Repository 1: AI_ASSISTANT_PhaseB_Integration equivalent
-        ("GET /", "GET", "/", 200, "Root endpoint returns 200"),
-        ("GET /health", "GET", "/health", 200, "Health endpoint returns 200"),
+        TestCase("GET /", "GET", "/", 200, "Root endpoint returns 200"),
+        TestCase("GET /health", "GET", "/health", 200, "Health endpoint returns 200"),
         
         # Repository 2: Nyaya_AI equivalent
-        ("GET /debug/info", "GET", "/debug/info", 200, "Debug info returns 200"),
-        ("POST /api/legal/query - valid", "POST", "/api/legal/query", 200, "Valid legal query returns 200", 
+        TestCase("GET /debug/info", "GET", "/debug/info", 200, "Debug info returns 200"),
+        TestCase("POST /api/legal/query - valid", "POST", "/api/legal/query", 200, "Valid legal query returns 200", 
          {"query": "What are my property rights?", "jurisdiction_hint": "IN", "domain_hint": "CIVIL"}),
-        ("POST /nyaya/query - valid", "POST", "/nyaya/query", 200, "Valid Nyaya query returns 200", 
+        TestCase("POST /nyaya/query - valid", "POST", "/nyaya/query", 200, "Valid Nyaya query returns 200", 
          {"query": "What are my legal rights?", "jurisdiction_hint": "IN", "domain_hint": "CIVIL"}),
-        ("POST /nyaya/multi_jurisdiction - valid", "POST", "/nyaya/multi_jurisdiction", 200, "Multi-jurisdiction query returns 200", 
+        TestCase("POST /nyaya/multi_jurisdiction - valid", "POST", "/nyaya/multi_jurisdiction", 200, "Multi-jurisdiction query returns 200", 
          {"query": "Property law comparison", "jurisdictions": ["IN", "UK"]}),
          
         # Repository 3: nyaya-legal-procedure-datasets integration
-        ("GET /nyaya/trace/{trace_id}", "GET", "/nyaya/trace/test123", 200, "Trace endpoint returns 200"),
+        TestCase("GET /nyaya/trace/{trace_id}", "GET", "/nyaya/trace/test123", 200, "Trace endpoint returns 200"),
         
         # Webhook functionality from integrated system
-        ("GET /webhook (verification)", "GET", "/webhook", 200, "Webhook endpoint exists"),
-        ("GET /webhook with challenge", "GET", "/webhook?hub.challenge=12345", 200, "Webhook challenge verification works"),
-        ("POST /webhook - valid data", "POST", "/webhook", 200, "Webhook accepts data", 
+        TestCase("GET /webhook (verification)", "GET", "/webhook", 200, "Webhook endpoint exists"),
+        TestCase("GET /webhook with challenge", "GET", "/webhook?hub.challenge=12345", 200, "Webhook challenge verification works"),
+        TestCase("POST /webhook - valid data", "POST", "/webhook", 200, "Webhook accepts data", 
          {"message": "test webhook", "type": "message"}),
         
         # Error handling and validation
-        ("POST /api/legal/query - empty query", "POST", "/api/legal/query", 400, "Empty query returns 400", 
+        TestCase("POST /api/legal/query - empty query", "POST", "/api/legal/query", 400, "Empty query returns 400", 
          {"query": ""}),
-        ("POST /api/legal/query - missing query", "POST", "/api/legal/query", 400, "Missing query returns 400", 
+        TestCase("POST /api/legal/query - missing query", "POST", "/api/legal/query", 400, "Missing query returns 400", 
          {}),
-        ("POST /nyaya/query - empty query", "POST", "/nyaya/query", 400, "Empty Nyaya query returns 400", 
+        TestCase("POST /nyaya/query - empty query", "POST", "/nyaya/query", 400, "Empty Nyaya query returns 400", 
          {"query": ""}),
-        ("POST /nyaya/multi_jurisdiction - missing jurisdictions", "POST", "/nyaya/multi_jurisdiction", 400, "Missing jurisdictions returns 400", 
+        TestCase("POST /nyaya/multi_jurisdiction - missing jurisdictions", "POST", "/nyaya/multi_jurisdiction", 400, "Missing jurisdictions returns 400", 
          {"query": "test"}),
          
         # Security and approval system
-        ("POST /api/legal/query - approval test", "POST", "/api/legal/query", 403, "Approval system rejects unsafe content", 
+        TestCase("POST /api/legal/query - approval test", "POST", "/api/legal/query", 403, "Approval system rejects unsafe content", 
          {"query": "exec(import os)", "content": "dangerous"}),
-        ("POST /nyaya/query - approval test", "POST", "/nyaya/query", 403, "Approval system rejects unsafe Nyaya content", 
+        TestCase("POST /nyaya/query - approval test", "POST", "/nyaya/query", 403, "Approval system rejects unsafe Nyaya content", 
          {"query": "eval(__import__('os'))", "content": "malicious"}),
          
         # Error scenarios - should never return 500
-        ("GET /nonexistent", "GET", "/nonexistent", 200, "Nonexistent endpoint returns 200 (not 500)"),
-        ("POST /api/wrong-endpoint", "POST", "/api/wrong-endpoint", 200, "Wrong API endpoint returns 200 (not 500)", {}),
-        ("POST /nyaya/wrong-endpoint", "POST", "/nyaya/wrong-endpoint", 200, "Wrong Nyaya endpoint returns 200 (not 500)", {}),
+        TestCase("GET /nonexistent", "GET", "/nonexistent", 200, "Nonexistent endpoint returns 200 (not 500)"),
+        TestCase("POST /api/wrong-endpoint", "POST", "/api/wrong-endpoint", 200, "Wrong API endpoint returns 200 (not 500)", {}),
+        TestCase("POST /nyaya/wrong-endpoint", "POST", "/nyaya/wrong-endpoint", 200, "Wrong Nyaya endpoint returns 200 (not 500)", {}),
     ]
+    test_cases = with_urls(base_url, test_cases)
     
     print(f"Testing integrated server at {base_url}")
     print("-" * 80)
     
-    for i, test_case in enumerate(test_cases, 1):
-        test_results["total"] += 1
-        test_name, method, path, expected_status, description = test_case[:5]
-        data = test_case[5] if len(test_case) > 5 else None
+    responses = run_concurrently(run_case, test_cases)
+    
+    for i, (test_case, response) in enumerate(zip(test_cases, responses), 1):
+        expected_status = test_case.expected
         
-        print(f"{i:2d}. {test_name}")
-        print(f"    Description: {description}")
-        print(f"    Expected: {expected_status}")
+        # Each case's report is collected and written in one call
+        lines = []
+        lines.append(f"{i:2d}. {test_case.name}")
+        lines.append(f"    Description: {test_case.desc}")
+        lines.append(f"    Expected: {expected_status}")
         
         try:
-            url = f"{base_url}{path}"
-            
-            if method == "GET":
-                response = requests.get(url, timeout=5)
-            elif method == "POST":
-                response = requests.post(url, json=data, timeout=5)
+            if isinstance(response, Exception):
+                raise response
             
             actual_status = response.status_code
-            print(f"    Actual: {actual_status}")
+            lines.append(f"    Actual: {actual_status}")
             
-            # Check for 500 errors - these should NEVER occur
-            if actual_status == 500:
-                print(f"    ❌ CRITICAL FAILURE: Got 500 error!")
-                test_results["failed"] += 1
-            elif actual_status == expected_status:
-                print(f"    ✅ PASSED: Status code matches expected")
-                test_results["passed"] += 1
-            else:
-                # Some variance is acceptable if it's not a 500
-                if actual_status not in [500, 502, 503, 504]:
-                    print(f"    ⚠️  Status mismatch but not 500: expected {expected_status}, got {actual_status}")
-                    test_results["passed"] += 1  # Count as passed if not 500
-                else:
-                    print(f"    ❌ FAILED: Server error {actual_status}")
-                    test_results["failed"] += 1
+            # 5xx must never occur; any other mismatch is acceptable variance
+            status_ok = actual_status != 500 and (actual_status == expected_status or actual_status not in (502, 503, 504))
+            test_results.update(("total", "passed" if status_ok else "failed"))
+            lines.append(f"    {'✅ PASSED' if status_ok else '❌ FAILED'}: expected {expected_status}, got {actual_status}")
             
-            # Try to parse response for structure validation
-            try:
-                response_json = response.json()
-                print(f"    Response keys: {list(response_json.keys())[:5]}")  # Show first 5 keys
+            # Parse response for structure validation; plain-text bodies
+            # (e.g. the webhook challenge echo) are skipped without parsing
+            response_json = json_body(response)
+            if response_json is not None:
+                lines.append(f"    Response keys: {list(response_json.keys())[:5]}")  # Show first 5 keys
                 
                 # Check for required structure fields
                 required_fields = ["trace_id", "status", "message", "timestamp"]
                 has_required_fields = all(field in response_json for field in required_fields if field != "timestamp" or "timestamp" in response_json)
                 
                 if has_required_fields or "trace_id" in response_json:
-                    print(f"    ✅ Response has structure fields")
+                    lines.append(f"    ✅ Response has structure fields")
                 else:
-                    print(f"    ⚠️  Response missing structure fields")
-            except:
-                print(f"    ⚠️  Could not parse response as JSON")
+                    lines.append(f"    ⚠️  Response missing structure fields")
+            else:
+                lines.append(f"    ⚠️  Could not parse response as JSON")
                 
-        except requests.exceptions.ConnectionError:
-            print(f"    ❌ CONNECTION FAILED: Could not connect to server")
-            test_results["failed"] += 1
+        except ConnectionError:
+            lines.append(f"    ❌ CONNECTION FAILED: Could not connect to server")
+            test_results.update(("total", "failed"))
         except Exception as e:
-            print(f"    ❌ REQUEST ERROR: {e}")
-            test_results["failed"] += 1
+            lines.append(f"    ❌ REQUEST ERROR: {e}")
+            test_results.update(("total", "failed"))
         
-        print()
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     # Summary
     print("=" * 80)
@@ -155,104 +277,78 @@ def test_integrated_server():
     
     return test_results["failed"] == 0
 
-def test_repository_integration():
+def test_repository_integration(base_url):
     """Test that all three repositories are properly integrated"""
     print("\n" + "=" * 80)
     print("REPOSITORY INTEGRATION VERIFICATION")
     print("=" * 80)
     
-    # Start server
-    sys.path.insert(0, str(Path(__file__).parent))
-    from integrated_nyaya_server import run_integrated_server
-    
-    def server_thread():
-        run_integrated_server(port=8091)
-    
-    server = threading.Thread(target=server_thread, daemon=True)
-    server.start()
-    time.sleep(2)
-    
-    base_url = "http://localhost:8091"
-    
     # Test repository-specific functionality
     repo_tests = [
         # AI_ASSISTANT_PhaseB_Integration features
-        ("PhaseB Integration - Health Check", "GET", "/health", 200),
-        ("PhaseB Integration - API Keys", "GET", "/", 200),
+        TestCase("PhaseB Integration - Health Check", "GET", "/health", 200),
+        TestCase("PhaseB Integration - API Keys", "GET", "/", 200),
         
         # Nyaya_AI features
-        ("Nyaya AI - Query Endpoint", "POST", "/nyaya/query", 200, {"query": "Test query"}),
-        ("Nyaya AI - Multi-Jurisdiction", "POST", "/nyaya/multi_jurisdiction", 200, {"query": "Test", "jurisdictions": ["IN"]}),
-        ("Nyaya AI - Trace Endpoint", "GET", "/nyaya/trace/test123", 200),
+        TestCase("Nyaya AI - Query Endpoint", "POST", "/nyaya/query", 200, data={"query": "Test query"}),
+        TestCase("Nyaya AI - Multi-Jurisdiction", "POST", "/nyaya/multi_jurisdiction", 200, data={"query": "Test", "jurisdictions": ["IN"]}),
+        TestCase("Nyaya AI - Trace Endpoint", "GET", "/nyaya/trace/test123", 200),
         
         # Legal Procedure Datasets integration
-        ("Legal Datasets - Data Access", "GET", "/", 200),  # Through main endpoint
+        TestCase("Legal Datasets - Data Access", "GET", "/", 200),  # Through main endpoint
         
         # Combined functionality
-        ("Combined - Legal Query", "POST", "/api/legal/query", 200, {"query": "Property rights"}),
-        ("Combined - Webhook Support", "POST", "/webhook", 200, {"event": "test"}),
+        TestCase("Combined - Legal Query", "POST", "/api/legal/query", 200, data={"query": "Property rights"}),
+        TestCase("Combined - Webhook Support", "POST", "/webhook", 200, data={"event": "test"}),
     ]
+    repo_tests = with_urls(base_url, repo_tests)
     
-    repo_results = {"passed": 0, "total": 0}
+    repo_results = Counter()
     
-    for test_name, method, path, expected_status, *data in repo_tests:
+    responses = run_concurrently(run_case, repo_tests)
+    
+    lines = []
+    for test_case, response in zip(repo_tests, responses):
         repo_results["total"] += 1
-        print(f"\nTesting {test_name}:")
-        print(f"  Expected status: {expected_status}")
+        expected_status = test_case.expected
+        lines.append(f"\nTesting {test_case.name}:")
+        lines.append(f"  Expected status: {expected_status}")
         
         try:
-            if method == "GET":
-                response = requests.get(f"{base_url}{path}", timeout=5)
-            else:
-                payload = data[0] if data else {}
-                response = requests.post(f"{base_url}{path}", json=payload, timeout=5)
+            if isinstance(response, Exception):
+                raise response
             
             actual_status = response.status_code
-            print(f"  Actual status: {actual_status}")
+            lines.append(f"  Actual status: {actual_status}")
             
-            if actual_status == 500:
-                print(f"  ❌ CRITICAL: Got 500 error!")
-            elif actual_status == expected_status or (actual_status != 500 and expected_status == 200):
-                print(f"  ✅ PASSED: Status {actual_status} as expected")
+            status_ok = actual_status != 500 and (actual_status == expected_status or expected_status == 200)
+            if status_ok:
                 repo_results["passed"] += 1
-            else:
-                print(f"  ⚠️  Status mismatch: expected {expected_status}, got {actual_status}")
+            lines.append(f"  {'✅ PASSED' if status_ok else '❌ FAILED'}: expected {expected_status}, got {actual_status}")
                 
             # Check response structure
-            try:
-                resp_data = response.json()
-                if "trace_id" in resp_data:
-                    print(f"  ✅ Has proper trace_id structure")
-                else:
-                    print(f"  ⚠️  Missing trace_id in response")
-            except:
-                print(f"  ⚠️  Could not parse response")
+            resp_data = json_body(response)
+            if resp_data is None:
+                lines.append(f"  ⚠️  Could not parse response")
+            elif "trace_id" in resp_data:
+                lines.append(f"  ✅ Has proper trace_id structure")
+            else:
+                lines.append(f"  ⚠️  Missing trace_id in response")
                 
         except Exception as e:
-            print(f"  ❌ Error during test: {e}")
+            lines.append(f"  ❌ Error during test: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\nRepository integration tests: {repo_results['passed']}/{repo_results['total']} passed")
     return repo_results["passed"] == repo_results["total"]
 
-def test_error_handling():
+def test_error_handling(base_url):
     """Test that error handling works properly across all integrated components"""
     print("\n" + "=" * 80)
     print("COMPREHENSIVE ERROR HANDLING VERIFICATION")
     print("=" * 80)
     
-    # Start server
-    sys.path.insert(0, str(Path(__file__).parent))
-    from integrated_nyaya_server import run_integrated_server
-    
-    def server_thread():
-        run_integrated_server(port=8092)
-    
-    server = threading.Thread(target=server_thread, daemon=True)
-    server.start()
-    time.sleep(2)
-    
-    base_url = "http://localhost:8092"
-    
     # Test various error scenarios across all integrated components
     error_tests = [
         ("Invalid JSON payload - Legal", "/api/legal/query", {"invalid": "json", "query": "test"}, True),
@@ -267,63 +363,58 @@ def test_error_handling():
         ("Cross-site scripting attempt", "/nyaya/query", {"query": "<script>alert('XSS')</script>"}, True),
     ]
     
-    error_results = {"passed": 0, "total": 0}
+    error_results = Counter()
+    
+    def send_error_case(error_test):
+        _, path, data, is_json = error_test
+        if is_json:
+            return SESSION.post(f"{base_url}{path}", json=data, timeout=REQUEST_TIMEOUT)
+        return SESSION.post(f"{base_url}{path}", data=data, timeout=REQUEST_TIMEOUT)
+    
+    responses = run_concurrently(send_error_case, error_tests)
     
-    for test_name, path, data, is_json in error_tests:
+    lines = []
+    for (test_name, path, data, is_json), response in zip(error_tests, responses):
         error_results["total"] += 1
-        print(f"\nTesting {test_name}:")
+        lines.append(f"\nTesting {test_name}:")
         
         try:
-            if is_json:
-                response = requests.post(f"{base_url}{path}", json=data, timeout=5)
-            else:
-                response = requests.post(f"{base_url}{path}", data=data, timeout=5)
+            if isinstance(response, Exception):
+                raise response
             
             status = response.status_code
-            print(f"  Status: {status}")
+            lines.append(f"  Status: {status}")
             
             # Should not be 500
             if status == 500:
-                print(f"  ❌ FAILED: Got 500 error")
+                lines.append(f"  ❌ FAILED: Got 500 error")
             else:
-                print(f"  ✅ PASSED: No 500 error ({status})")
+                lines.append(f"  ✅ PASSED: No 500 error ({status})")
                 error_results["passed"] += 1
                 
                 # Should have proper structure
-                try:
-                    resp_data = response.json()
-                    if "trace_id" in resp_data and "status" in resp_data:
-                        print(f"  ✅ Has proper error structure")
-                    else:
-                        print(f"  ⚠️  Missing structure fields")
-                except:
-                    print(f"  ⚠️  Could not parse response")
+                resp_data = json_body(response)
+                if resp_data is None:
+                    lines.append(f"  ⚠️  Could not parse response")
+                elif "trace_id" in resp_data and "status" in resp_data:
+                    lines.append(f"  ✅ Has proper error structure")
+                else:
+                    lines.append(f"  ⚠️  Missing structure fields")
                     
         except Exception as e:
-            print(f"  ❌ Error during test: {e}")
+            lines.append(f"  ❌ Error during test: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\nError handling tests: {error_results['passed']}/{error_results['total']} passed")
     return error_results["passed"] == error_results["total"]
 
-def test_security_features():
+def test_security_features(base_url):
     """Test security features including approval system and webhook validation"""
     print("\n" + "=" * 80)
     print("SECURITY FEATURES VERIFICATION")
     print("=" * 80)
     
-    # Start server
-    sys.path.insert(0, str(Path(__file__).parent))
-    from integrated_nyaya_server import run_integrated_server
-    
-    def server_thread():
-        run_integrated_server(port=8093)
-    
-    server = threading.Thread(target=server_thread, daemon=True)
-    server.start()
-    time.sleep(2)
-    
-    base_url = "http://localhost:8093"
-    
     # Test security features
     security_tests = [
         ("Safety approval - Safe content", {"query": "What are my legal rights?", "domain": "CIVIL"}, 200),
@@ -333,30 +424,40 @@ def test_security_features():
         ("Webhook signature validation", {"event": "test"}, 200),  # Normal webhook should pass
     ]
     
-    security_results = {"passed": 0, "total": 0}
+    security_results = Counter()
     
-    for test_name, data, expected_status in security_tests:
+    def send_security_case(security_test):
+        # Every security case targets the legal endpoint
+        return SESSION.post(f"{base_url}/api/legal/query", json=security_test[1], timeout=REQUEST_TIMEOUT)
+    
+    responses = run_concurrently(send_security_case, security_tests)
+    
+    lines = []
+    for (test_name, data, expected_status), response in zip(security_tests, responses):
         security_results["total"] += 1
-        print(f"\nTesting {test_name}:")
-        print(f"  Expected status: {expected_status}")
+        lines.append(f"\nTesting {test_name}:")
+        lines.append(f"  Expected status: {expected_status}")
         
         try:
-            # Test legal endpoint
-            response = requests.post(f"{base_url}/api/legal/query", json=data, timeout=5)
+            if isinstance(response, Exception):
+                raise response
+            
             actual_status = response.status_code
-            print(f"  Actual status: {actual_status}")
+            lines.append(f"  Actual status: {actual_status}")
             
             if actual_status == expected_status or (actual_status != 500 and expected_status == 403):
                 # Approval system should return 403 for dangerous content
-                print(f"  ✅ PASSED: Status {actual_status} as expected")
+                lines.append(f"  ✅ PASSED: Status {actual_status} as expected")
                 security_results["passed"] += 1
             elif actual_status == 500:
-                print(f"  ❌ CRITICAL: Got 500 error!")
+                lines.append(f"  ❌ CRITICAL: Got 500 error!")
             else:
-                print(f"  ⚠️  Status mismatch: expected {expected_status}, got {actual_status}")
+                lines.append(f"  ⚠️  Status mismatch: expected {expected_status}, got {actual_status}")
                 
         except Exception as e:
-            print(f"  ❌ Error during test: {e}")
+            lines.append(f"  ❌ Error during test: {e}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     print(f"\nSecurity tests: {security_results['passed']}/{security_results['total']} passed")
     return security_results["passed"] == security_results["total"]
@@ -367,17 +468,27 @@ def main():
     print("This verifies all three repositories have been properly integrated")
     print()
     
+    # The handlers are stateless, so one server instance serves every test group
+    # A separate process keeps the server's request handling off this
+    # process's GIL while the client fans out concurrent requests
+    server = multiprocessing.Process(target=run_integrated_server, kwargs={"port": 8090}, daemon=True)
+    server.start()
+    atexit.register(server.terminate)
+    
+    base_url = "http://localhost:8090"
+    wait_ready(base_url)
+    
     # Test 1: Basic functionality
-    functionality_success = test_integrated_server()
+    functionality_success = test_integrated_server(base_url)
     
     # Test 2: Repository integration
-    integration_success = test_repository_integration()
+    integration_success = test_repository_integration(base_url)
     
     # Test 3: Error handling
-    error_handling_success = test_error_handling()
+    error_handling_success = test_error_handling(base_url)
     
     # Test 4: Security features
-    security_success = test_security_features()
+    security_success = test_security_features(base_url)
     
     print("\n" + "=" * 80)
     print("FINAL INTEGRATION VERIFICATION RESULTS")
@@ -2,21 +2,393 @@
 Legal Data Loader for Nyaya AI Backend
 Loads and processes legal data from jurisdiction-specific JSON datasets
 """
+import heapq
 import json
+import logging
+import mmap
 import os
 import re
-from typing import Dict, List, Optional, Tuple
-from collections import defaultdict
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import ChainMap, Counter, defaultdict, namedtuple
+from functools import lru_cache, partial
+from itertools import count
+
+logger = logging.getLogger(__name__)
+
+# orjson parses the multi-MB law datasets several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Accepted spellings of an explicit jurisdiction hint (upper-cased)
+JURISDICTION_HINT_MAP = {
+    'IN': 'IN', 'INDIA': 'IN', 'INDIAN': 'IN',
+    'UAE': 'UAE', 'DUBAI': 'UAE', 'ABU DHABI': 'UAE',
+    'UK': 'UK', 'UNITED KINGDOM': 'UK', 'BRITAIN': 'UK'
+}
+
+# Jurisdiction indicators in the query, checked in priority order. Each
+# jurisdiction's terms are one compiled alternation so the query is scanned
+# once per jurisdiction instead of once per term.
+JURISDICTION_QUERY_PATTERNS = tuple(
+    (jurisdiction, re.compile('|'.join(map(re.escape, terms))))
+    for jurisdiction, terms in (
+        ('IN', ['INDIA', 'INDIAN']),
+        ('UAE', ['UAE', 'DUBAI', 'ABU DHABI', 'SHARJAH']),
+        ('UK', ['UK', 'UNITED KINGDOM', 'BRITAIN', 'ENGLAND'])
+    )
+)
+
+# Technology vocabulary used to spot cyber-crime queries and boost matching
+# provisions. Built once at import instead of on every search call.
+TECH_TERMS = frozenset({
+    'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access',
+    'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
+    'smartphone', 'tablet', 'laptop', 'internet', 'network', 'wifi', 'bluetooth',
+    'malware', 'virus', 'trojan', 'spyware', 'phishing', 'identity theft',
+    'online', 'e-commerce', 'digital signature', 'encryption'
+})
+
+# Terms used by _evaluate_relevance to reject family-law results for tech queries
+TECH_QUERY_TERMS = frozenset({
+    'phone', 'mobile', 'device', 'access', 'unauthorized', 'cyber', 'hacking',
+    'computer', 'digital', 'electronic', 'privacy', 'data', 'security'
+})
+PERSONAL_STATUS_TERMS = frozenset({
+    'divorce', 'marriage', 'family', 'personal status', 'child support',
+    'custody', 'spouse', 'inheritance', 'will', 'estate', 'property division'
+})
+TECH_RESULT_TERMS = frozenset({
+    'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access',
+    'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
+    'internet', 'network', 'fraud', 'theft', 'unauthorized access', 'intrusion',
+    'malware', 'virus', 'identity theft', 'phishing'
+})
+
+# The same term sets as single alternations; matching stays substring-based
+# (no word boundaries) and callers pass already-lowercased text
+TECH_QUERY_RE = re.compile('|'.join(map(re.escape, sorted(TECH_QUERY_TERMS))))
+PERSONAL_STATUS_RE = re.compile('|'.join(map(re.escape, sorted(PERSONAL_STATUS_TERMS))))
+TECH_RESULT_RE = re.compile('|'.join(map(re.escape, sorted(TECH_RESULT_TERMS))))
+
+# Enhanced tech query mapping - map common tech queries to relevant legal concepts
+TECH_QUERY_MAPPING = {
+    'unauthorized access': ['unauthorized access', 'computer misuse', 'cyber theft', 'data theft', 'intrusion', 'hacking'],
+    'phone': ['phone', 'mobile', 'device', 'electronic', 'telecommunication'],
+    'privacy': ['privacy', 'data protection', 'personal information'],
+    'hacking': ['hacking', 'cyber attack', 'intrusion', 'unauthorized access'],
+    'computer': ['computer', 'digital', 'electronic', 'device']
+}
+
+# How each section table is searched: the detail fields that, after the
+# section key, make up the scored text; the title/content handed to
+# _evaluate_relevance; the result fields; the confidence cap; and, when
+# set, the only domains the table is searched for. Builders take
+# (law_name, key, details), law_name being None outside grouped tables.
+# Tables are searched in the order listed.
+SectionSpec = namedtuple('SectionSpec', 'fields title content result confidence_cap domains', defaults=(None,))
+
+SECTION_SPECS = {
+    'IN': {
+        'bns_sections': SectionSpec(
+            fields=('offence',),
+            title=lambda law_name, offence, details: f"{offence} {details.get('offence', '')}",
+            content=lambda law_name, offence, details: f"{details.get('punishment', '')} {details.get('elements_required', [])} {details.get('process_steps', [])}",
+            result=lambda law_name, offence, details: {
+                'type': 'bns_section',
+                'offence': offence,
+                'section': details.get('section', ''),
+                'punishment': details.get('punishment', ''),
+                'elements': details.get('elements_required', []),
+                'process': details.get('process_steps', [])
+            },
+            confidence_cap=0.95
+        ),
+        'ipc_sections': SectionSpec(
+            fields=('title', 'description'),
+            title=lambda law_name, section, details: f"{section} {details.get('title', '')}",
+            content=lambda law_name, section, details: f"{details.get('description', '')} {details.get('punishment', '')}",
+            result=lambda law_name, section, details: {
+                'type': 'ipc_section',
+                'section': section,
+                'title': details.get('title', ''),
+                'description': details.get('description', ''),
+                'punishment': details.get('punishment', '')
+            },
+            confidence_cap=0.9
+        ),
+        'cpc_sections': SectionSpec(
+            fields=('title',),
+            title=lambda law_name, section, details: f"{section} {details.get('title', '')}",
+            content=lambda law_name, section, details: f"{details.get('procedure', '')}",
+            result=lambda law_name, section, details: {
+                'type': 'cpc_section',
+                'section': section,
+                'title': details.get('title', ''),
+                'procedure': details.get('procedure', '')
+            },
+            confidence_cap=0.8,
+            domains=('civil',)
+        )
+    },
+    'UAE': {
+        'civil_law': SectionSpec(
+            fields=('offence', 'title', 'description'),
+            title=lambda law_name, article_id, details: f"{law_name} {article_id} {details.get('offence', '')}",
+            content=lambda law_name, article_id, details: f"{details.get('remedies', [])} {details.get('process_steps', [])} {details.get('description', '')}",
+            result=lambda law_name, article_id, details: {
+                'type': 'civil_law',
+                'law': law_name,
+                'article': article_id,
+                'offence': details.get('offence', ''),
+                'remedies': details.get('civil_remedies', []),
+                'process': details.get('process_steps', [])
+            },
+            confidence_cap=0.9
+        ),
+        'criminal_law': SectionSpec(
+            fields=('offence', 'title', 'description'),
+            title=lambda law_name, section_id, details: f"{law_name} {section_id} {details.get('offence', '')}",
+            content=lambda law_name, section_id, details: f"{details.get('punishment', '')} {details.get('description', '')}",
+            result=lambda law_name, section_id, details: {
+                'type': 'criminal_law',
+                'law': law_name,
+                'section': section_id,
+                'offence': details.get('offence', ''),
+                'punishment': details.get('punishment', '')
+            },
+            confidence_cap=0.95
+        )
+    },
+    'UK': {
+        'criminal_law': SectionSpec(
+            fields=('offence', 'title', 'description'),
+            title=lambda law_name, section, details: f"{section} {details.get('offence', '')} {details.get('title', '')}",
+            content=lambda law_name, section, details: f"{details.get('description', '')} {details.get('punishment', '')}",
+            result=lambda law_name, section, details: {
+                'type': 'criminal_law',
+                'section': section,
+                'offence': details.get('offence', ''),
+                'punishment': details.get('punishment', '')
+            },
+            confidence_cap=0.95
+        ),
+        'civil_law': SectionSpec(
+            fields=('title', 'description'),
+            title=lambda law_name, section, details: f"{section} {details.get('title', '')}",
+            content=lambda law_name, section, details: f"{details.get('description', '')} {details.get('procedure', '')}",
+            result=lambda law_name, section, details: {
+                'type': 'civil_law',
+                'section': section,
+                'title': details.get('title', ''),
+                'procedure': details.get('procedure', '')
+            },
+            confidence_cap=0.9
+        )
+    }
+}
+# UAE tables group their articles under the name of the law they belong to
+GROUPED_SECTION_JURISDICTIONS = frozenset({'UAE'})
+
+# Number of dataset matches a search returns
+MAX_SEARCH_RESULTS = 3
+
+
+def _push_top_match(heap: List, order: count, relevance_score: float, build_result: Callable[[], Dict]):
+    """Keep only the MAX_SEARCH_RESULTS best results in a min-heap while scanning
+    
+    Entries are (score, -arrival, build_result): among equal scores the
+    earlier result ranks higher, matching a stable sort by descending
+    relevance. Result dicts are only built, by _ranked_matches, for the
+    entries still in the heap at the end.
+    """
+    entry = (relevance_score, -next(order), build_result)
+    if len(heap) < MAX_SEARCH_RESULTS:
+        heapq.heappush(heap, entry)
+    else:
+        heapq.heappushpop(heap, entry)
+
+
+def _ranked_matches(heap: List) -> List[Dict]:
+    """Results kept by _push_top_match, best first"""
+    return [build_result() for _, _, build_result in sorted(heap, reverse=True)]
+
+
+@lru_cache(maxsize=4096)
+def _detect_jurisdiction(query: str, jurisdiction_hint: Optional[str]) -> str:
+    """Detect jurisdiction from query or hint (pure, so memoized per query)"""
+    # Priority: explicit hint > query content > default
+    if jurisdiction_hint:
+        hint_jurisdiction = JURISDICTION_HINT_MAP.get(jurisdiction_hint.upper())
+        if hint_jurisdiction:
+            return hint_jurisdiction
+    
+    # Check query for jurisdiction indicators
+    query_upper = query.upper()
+    for jurisdiction, pattern in JURISDICTION_QUERY_PATTERNS:
+        if pattern.search(query_upper):
+            return jurisdiction
+    
+    # Default to India
+    return 'IN'
+
+
+@lru_cache(maxsize=2048)
+def _tokenize(query: str) -> Tuple[str, frozenset]:
+    """Lowercase a query and split it into its word set, shared by classify and search"""
+    query_lower = query.lower()
+    return query_lower, frozenset(map(sys.intern, query_lower.split()))
+
+
+# format_response builders, one per result type: each returns the guidance
+# section for an item and the citations it contributes
+
+def _format_bns_section(item: Dict) -> Tuple[Dict, List[str]]:
+    section = item['section']
+    title = f"BNS Section {section} - {item['offence']}"
+    punishment = item['punishment']
+    return {
+        "title": title,
+        "definition": item.get('definition', 'Refer to Bharatiya Nyaya Sanhita for complete definition'),
+        "content": f"Punishment: {punishment}",
+        "elements": item.get('elements', []),
+        "process": item.get('process', []),
+        "penalties": {
+            "imprisonment": punishment,
+            "fine": "As determined by court"
+        }
+    }, [f"Bharatiya Nyaya Sanhita Section {section}"]
+
+
+def _format_ipc_section(item: Dict) -> Tuple[Dict, List[str]]:
+    section = item['section']
+    return {
+        "title": f"IPC {section} - {item['title']}",
+        "definition": item.get('definition', 'Refer to Indian Penal Code for complete definition'),
+        "content": item.get('description', ''),
+        "elements": item.get('elements_required', []),
+        "process": item.get('process_steps', []),
+        "penalties": {
+            "imprisonment": item.get('punishment', 'Refer to IPC section for details'),
+            "fine": "As determined by court"
+        }
+    }, [f"Indian Penal Code Section {section}"]
+
+
+def _format_cpc_section(item: Dict) -> Tuple[Dict, List[str]]:
+    section = item['section']
+    return {
+        "title": f"CPC {section} - {item['title']}",
+        "definition": "Civil procedure provision",
+        "procedure": item.get('procedure', []),
+        "process": item.get('process_steps', [])
+    }, [f"Civil Procedure Code Section {section}"]
+
+
+def _format_it_act_section(item: Dict) -> Tuple[Dict, List[str]]:
+    section = item['section']
+    section_data = {
+        "title": f"IT Act {section} - {item['title']}",
+        "definition": item.get('definition', 'Refer to Information Technology Act for complete definition'),
+        "content": item.get('description', ''),
+        "elements": item.get('elements', []),
+        "process": item.get('process', []),
+        "penalties": item.get('penalties', {
+            "compensation": "As per IT Act provisions",
+            "imprisonment": "As per IT Act provisions",
+            "fine": "As determined by court"
+        }),
+        "citations": item.get('citations', [
+            f"Information Technology Act, 2000, {section}"
+        ])
+    }
+    # Add specific citations if provided
+    if 'citations' in item:
+        return section_data, item['citations']
+    return section_data, [f"Information Technology Act Section {section}"]
+
+
+def _format_civil_law(item: Dict) -> Tuple[Dict, List[str]]:
+    law = item['law']
+    article = item['article']
+    return {
+        "title": f"{law} - {article}",
+        "definition": "Civil law provision",
+        "content": item.get('offence', ''),
+        "remedies": item.get('remedies', []),
+        "process": item.get('process', []),
+        "elements": item.get('elements_required', [])
+    }, [f"{law} {article}"]
+
+
+def _format_criminal_law(item: Dict) -> Tuple[Dict, List[str]]:
+    title = f"{item['law']} - {item['title']}"
+    section_data = {
+        "title": title,
+        "definition": item.get('definition', 'Refer to criminal code for complete definition'),
+        "content": item.get('offence', ''),
+        "elements": item.get('elements', []),
+        "process": item.get('process', []),
+        "penalties": item.get('punishment', {
+            "imprisonment": "As prescribed by law",
+            "fine": "As determined by court"
+        }),
+        "citations": item.get('citations', [])
+    }
+    # Add specific citations if provided
+    if 'citations' in item:
+        return section_data, item['citations']
+    return section_data, [title]
+
+
+RESULT_FORMATTERS = {
+    'bns_section': _format_bns_section,
+    'ipc_section': _format_ipc_section,
+    'cpc_section': _format_cpc_section,
+    'it_act_section': _format_it_act_section,
+    'civil_law': _format_civil_law,
+    'criminal_law': _format_criminal_law
+}
+
 
 class LegalDataLoader:
     """Handles loading and querying legal data from JSON datasets"""
     
+    domain_files = {
+        'IN': 'indian_domain_map.json',
+        'UAE': 'uae_domain_map.json',
+        'UK': 'uk_domain_map.json'
+    }
+    dataset_files = {
+        'IN': 'indian_law_dataset.json',
+        'UAE': 'uae_law_dataset.json',
+        'UK': 'uk_law_dataset.json'
+    }
+    
     def __init__(self, data_directory: str = "Nyaya_AI/db"):
         self.data_directory = data_directory
+        # Per-jurisdiction caches, filled on first access by get_domain_map /
+        # get_law_dataset (None records a file that failed to load)
         self.domain_maps = {}
         self.law_datasets = {}
-        self._load_domain_maps()
-        self._load_law_datasets()
+        self._keyword_phrases = {}
+        self._keyword_index = {}
+        self._section_index = {}
+        self._it_act_index = {}
+        # Classification only depends on the query and the (load-once) domain
+        # map, so results are memoized per loader instance
+        self._classify_domain_cached = lru_cache(maxsize=4096)(self._classify_domain)
+        # Searches are likewise pure over the loaded datasets; cached results
+        # are kept as tuples so callers always get a fresh list
+        self._search_law_data_cached = lru_cache(maxsize=2048)(self._search_law_data)
+        self._search_fns = {
+            'IN': self._search_indian_law,
+            'UAE': self._search_uae_law,
+            'UK': self._search_uk_law
+        }
         # Initialize fallback provisions
         self.fallback_provisions = {
             'UAE': {
@@ -90,265 +462,9 @@ class LegalDataLoader:
                 }
             }
         }
-    
-    def _load_domain_maps(self):
-        """Load all domain mapping files"""
-        domain_files = {
-            'IN': 'indian_domain_map.json',
-            'UAE': 'uae_domain_map.json', 
-            'UK': 'uk_domain_map.json'
-        }
-        
-        for jurisdiction, filename in domain_files.items():
-            filepath = os.path.join(self.data_directory, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self.domain_maps[jurisdiction] = json.load(f)
-            except FileNotFoundError:
-                print(f"Warning: Domain map not found for {jurisdiction}: {filepath}")
-            except Exception as e:
-                print(f"Error loading domain map for {jurisdiction}: {e}")
-    
-    def _load_law_datasets(self):
-        """Load all law dataset files"""
-        dataset_files = {
-            'IN': 'indian_law_dataset.json',
-            'UAE': 'uae_law_dataset.json',
-            'UK': 'uk_law_dataset.json'
-        }
-        
-        for jurisdiction, filename in dataset_files.items():
-            filepath = os.path.join(self.data_directory, filename)
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    self.law_datasets[jurisdiction] = json.load(f)
-            except FileNotFoundError:
-                print(f"Warning: Law dataset not found for {jurisdiction}: {filepath}")
-            except Exception as e:
-                print(f"Error loading law dataset for {jurisdiction}: {e}")
-    
-    def detect_jurisdiction(self, query: str, jurisdiction_hint: Optional[str] = None) -> str:
-        """Detect jurisdiction from query or hint"""
-        # Priority: explicit hint > query content > default
-        if jurisdiction_hint:
-            jurisdiction_map = {
-                'IN': 'IN', 'INDIA': 'IN', 'INDIAN': 'IN',
-                'UAE': 'UAE', 'DUBAI': 'UAE', 'ABU DHABI': 'UAE',
-                'UK': 'UK', 'UNITED KINGDOM': 'UK', 'BRITAIN': 'UK'
-            }
-            hint_upper = jurisdiction_hint.upper()
-            if hint_upper in jurisdiction_map:
-                return jurisdiction_map[hint_upper]
-        
-        # Check query for jurisdiction indicators
-        query_upper = query.upper()
-        if any(term in query_upper for term in ['INDIA', 'INDIAN']):
-            return 'IN'
-        elif any(term in query_upper for term in ['UAE', 'DUBAI', 'ABU DHABI', 'SHARJAH']):
-            return 'UAE'
-        elif any(term in query_upper for term in ['UK', 'UNITED KINGDOM', 'BRITAIN', 'ENGLAND']):
-            return 'UK'
-        
-        # Default to India
-        return 'IN'
-    
-    def classify_domain(self, query: str, jurisdiction: str) -> Tuple[str, str, float]:
-        """Classify query domain and subdomain using domain mapping with improved semantic matching"""
-        if jurisdiction not in self.domain_maps:
-            return 'civil', 'general', 0.5
-        
-        domain_map = self.domain_maps[jurisdiction]
-        keyword_mapping = domain_map.get('keyword_mapping', {})
-        
-        # Count keyword matches for each subdomain with semantic weights
-        domain_scores = defaultdict(float)
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        for subdomain, keywords in keyword_mapping.items():
-            # Exact phrase matches get higher weight
-            exact_matches = 0
-            partial_matches = 0
-            
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Check for exact phrase match
-                if keyword_lower in query_lower:
-                    exact_matches += 1
-                
-                # Check for word matches
-                keyword_words = set(keyword_lower.split())
-                intersection = query_words.intersection(keyword_words)
-                partial_matches += len(intersection)
-            
-            # Calculate weighted score
-            if exact_matches > 0:
-                # Prioritize exact matches
-                domain_scores[subdomain] = min(1.0, (exact_matches * 2 + partial_matches) / len(keywords))
-            elif partial_matches > 0:
-                domain_scores[subdomain] = min(0.8, partial_matches / len(keywords))
-        
-        # Find best matching subdomain
-        if domain_scores:
-            best_subdomain = max(domain_scores, key=domain_scores.get)
-            confidence = domain_scores[best_subdomain]
-            
-            # Map subdomain to main domain
-            domain_mapping = domain_map.get('domain_mapping', {})
-            for main_domain, config in domain_mapping.items():
-                if best_subdomain in config.get('subdomains', []):
-                    return main_domain, best_subdomain, confidence
-        
-        # Fallback to default
-        fallback = domain_map.get('fallback_rules', {})
-        default_domain = fallback.get('default_domain', 'civil')
-        return default_domain, 'general', 0.3
-    
-    def search_law_data(self, query: str, jurisdiction: str, domain: str, subdomain: str) -> List[Dict]:
-        """Search for relevant legal data in the dataset"""
-        if jurisdiction not in self.law_datasets:
-            return []
-        
-        dataset = self.law_datasets[jurisdiction]
-        results = []
-        
-        # Search strategy varies by jurisdiction
-        if jurisdiction == 'IN':
-            results = self._search_indian_law(query, dataset, domain, subdomain)
-        elif jurisdiction == 'UAE':
-            results = self._search_uae_law(query, dataset, domain, subdomain)
-        elif jurisdiction == 'UK':
-            results = self._search_uk_law(query, dataset, domain, subdomain)
-        
-        return results
-    
-    def _evaluate_relevance(self, query: str, legal_title: str, legal_content: str) -> bool:
-        """Evaluate if a legal provision is truly relevant to the query"""
-        query_lower = query.lower()
-        title_lower = legal_title.lower()
-        content_lower = legal_content.lower()
-        
-        # Check for semantic relevance - if the query contains tech terms but the result is about personal status/family law
-        tech_query_terms = {'phone', 'mobile', 'device', 'access', 'unauthorized', 'cyber', 'hacking', 
-                           'computer', 'digital', 'electronic', 'privacy', 'data', 'security'}
-        personal_status_terms = {'divorce', 'marriage', 'family', 'personal status', 'child support', 
-                                'custody', 'spouse', 'inheritance', 'will', 'estate', 'property division'}
-        
-        query_has_tech = any(term in query_lower for term in tech_query_terms)
-        result_has_personal = any(term in (title_lower + " " + content_lower) for term in personal_status_terms)
-        
-        # If query is about technology but result is about personal/family law, it's likely irrelevant
-        if query_has_tech and result_has_personal:
-            return False
-            
-        # Check if both relate to similar topics
-        if query_has_tech:
-            tech_result_terms = {'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access', 
-                               'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
-                               'internet', 'network', 'fraud', 'theft', 'unauthorized access', 'intrusion',
-                               'hacking', 'malware', 'virus', 'identity theft', 'phishing'}
-            tech_in_result = any(term in (title_lower + " " + content_lower) for term in tech_result_terms)
-            return tech_in_result
-            
-        return True  # Default to true for non-tech queries
-
-    def _search_indian_law(self, query: str, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
-        """Search Indian law dataset with improved semantic matching"""
-        results = []
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        # Look for technology-related terms
-        tech_terms = {'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access', 
-                     'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
-                     'smartphone', 'tablet', 'laptop', 'internet', 'network', 'wifi', 'bluetooth',
-                     'malware', 'virus', 'trojan', 'spyware', 'phishing', 'identity theft',
-                     'online', 'e-commerce', 'digital signature', 'encryption'}
-        
-        # Enhanced tech query mapping - map common tech queries to relevant legal concepts
-        tech_query_mapping = {
-            'unauthorized access': ['unauthorized access', 'computer misuse', 'cyber theft', 'data theft', 'intrusion', 'hacking'],
-            'phone': ['phone', 'mobile', 'device', 'electronic', 'telecommunication'],
-            'privacy': ['privacy', 'data protection', 'personal information'],
-            'hacking': ['hacking', 'cyber attack', 'intrusion', 'unauthorized access'],
-            'computer': ['computer', 'digital', 'electronic', 'device']
-        }
         
-        # Fallback provisions for common queries by jurisdiction
-        fallback_provisions = {
-            'UAE': {
-                'murder': {
-                    'type': 'criminal_law',
-                    'law': 'Federal Penal Code Law No. 3 of 1987',
-                    'section': 'Articles related to homicide and murder',
-                    'title': 'Homicide and Murder Offences',
-                    'offence': 'Intentional killing of another person or causing death through criminal negligence',
-                    'definition': 'The unlawful killing of a human being with malice aforethought, including premeditated murder, voluntary manslaughter, and other forms of homicide under UAE Federal Penal Code',
-                    'elements': [
-                        'Intentional act causing death of another person',
-                        'Malice aforethought or criminal negligence',
-                        'Absence of legal justification or excuse',
-                        'Causation between act and death'
-                    ],
-                    'punishment': {
-                        'murder': 'Death penalty or life imprisonment for premeditated murder',
-                        'manslaughter': 'Imprisonment from 3 to 15 years for voluntary manslaughter',
-                        'negligent_homicide': 'Imprisonment up to 10 years for criminal negligence causing death'
-                    },
-                    'process': [
-                        'Immediate police investigation and crime scene preservation',
-                        'Medical examiner autopsy and cause of death determination',
-                        'Collection of forensic evidence and witness statements',
-                        'Public prosecution review and charging decision',
-                        'Criminal court trial with right to legal representation',
-                        'Supreme Court jurisdiction for death penalty cases',
-                        'Possibility of royal pardon or sentence reduction'
-                    ],
-                    'citations': [
-                        'UAE Federal Penal Code Law No. 3 of 1987, relevant articles on homicide',
-                        'UAE Constitution Article 18 - Right to life protection',
-                        'UAE Criminal Procedure Code for trial procedures',
-                        'Sharia law principles applicable to homicide cases'
-                    ]
-                },
-                'killed': {
-                    'type': 'criminal_law',
-                    'law': 'Federal Penal Code Law No. 3 of 1987',
-                    'section': 'Homicide and related offences',
-                    'title': 'Causing Death Through Criminal Acts',
-                    'offence': 'Causing death of another person through intentional or negligent criminal acts',
-                    'definition': 'Any criminal act that directly or indirectly results in the death of another person, including murder, manslaughter, and death caused through other criminal offences',
-                    'elements': [
-                        'Criminal act or omission',
-                        'Death of another person',
-                        'Causal connection between act and death',
-                        'Criminal intent or negligence'
-                    ],
-                    'punishment': {
-                        'intentional': 'Death penalty or life imprisonment',
-                        'negligent': 'Imprisonment from 1 to 10 years',
-                        'aggravated': 'Enhanced penalties for specific circumstances'
-                    },
-                    'process': [
-                        'Emergency response and crime scene investigation',
-                        'Forensic analysis and evidence collection',
-                        'Witness interrogation and suspect identification',
-                        'Prosecution case building and charging',
-                        'Trial in criminal court with full legal rights',
-                        'Appeal process through court hierarchy',
-                        'Execution or imprisonment based on verdict'
-                    ],
-                    'citations': [
-                        'UAE Federal Penal Code Law No. 3 of 1987',
-                        'UAE Criminal Procedure Law',
-                        'UAE Evidence Law for criminal proceedings',
-                        'International human rights standards applicable'
-                    ]
-                }
-            }
-        }
-        fallback_tech_provisions = {
+        # Fallback provisions for common tech queries (Indian IT Act)
+        self.fallback_tech_provisions = {
             'unauthorized access to phone': {
                 'type': 'it_act_section',
                 'section': 'IT Act Section 43, 66',
@@ -490,345 +606,386 @@ class LegalDataLoader:
             }
         }
         
-        # Check for direct fallback matches
-        direct_matches = []
-        for pattern, provision in fallback_tech_provisions.items():
-            if pattern in query_lower or any(term in query_lower for term in pattern.split()):
-                # Create a copy with relevance score
-                matched_provision = provision.copy()
-                matched_provision['relevance_score'] = 0.9
-                matched_provision['confidence'] = 0.9
-                direct_matches.append(matched_provision)
+        self._fallback_tech_matcher = self._build_fallback_matcher(self.fallback_tech_provisions)
+        self._fallback_uae_matcher = self._build_fallback_matcher(self.fallback_provisions['UAE'])
+    
+    @staticmethod
+    def _build_fallback_matcher(provisions: Dict) -> Tuple[re.Pattern, Dict[str, frozenset], List[Dict]]:
+        """Compile every word of every fallback pattern into one regex scan
+        
+        A pattern matches when any of its words occurs in the query (the full
+        pattern containing its own words). The regex is a zero-width lookahead
+        tried at every position with longer words first, so at each position
+        it reports the longest word starting there; the words it shadows are
+        prefixes of that word, so each word maps to the positions of every
+        pattern using it or one of its prefixes.
+        """
+        patterns = list(provisions)
+        words = sorted({word for pattern in patterns for word in pattern.split()}, key=len, reverse=True)
+        word_patterns = {
+            word: frozenset(index for index, pattern in enumerate(patterns)
+                            if any(word.startswith(term) for term in pattern.split()))
+            for word in words
+        }
+        regex = re.compile('(?=(%s))' % '|'.join(map(re.escape, words)))
+        return regex, word_patterns, list(provisions.values())
+    
+    @staticmethod
+    def _match_fallbacks(matcher: Tuple[re.Pattern, Dict[str, frozenset], List[Dict]], query_lower: str) -> List[Dict]:
+        """Provisions whose fallback pattern matches the query, in pattern order, at most MAX_SEARCH_RESULTS"""
+        regex, word_patterns, provisions = matcher
+        matched = set()
+        for match in regex.finditer(query_lower):
+            matched.update(word_patterns[match.group(1)])
+        return [provisions[index] for index in sorted(matched)[:MAX_SEARCH_RESULTS]]
+    
+    def _load_json(self, filename: str, label: str, jurisdiction: str) -> Optional[Dict]:
+        """Load one jurisdiction JSON file, returning None if it is missing or invalid"""
+        filepath = os.path.join(self.data_directory, filename)
+        try:
+            # Map the file instead of reading it into an intermediate buffer;
+            # orjson parses straight from the mapped pages
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if ORJSON_AVAILABLE:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
+                return json.loads(mapped[:])
+        except FileNotFoundError:
+            logger.warning("%s not found for %s: %s", label, jurisdiction, filepath)
+        except Exception as e:
+            logger.error("Error loading %s for %s: %s", label.lower(), jurisdiction, e)
+        return None
+    
+    def get_domain_map(self, jurisdiction: str) -> Optional[Dict]:
+        """Return the domain map for a jurisdiction, loading it on first use"""
+        if jurisdiction not in self.domain_maps:
+            if jurisdiction not in self.domain_files:
+                return None
+            domain_map = self._load_json(self.domain_files[jurisdiction], 'Domain map', jurisdiction)
+            if domain_map is not None:
+                keyword_mapping = domain_map.get('keyword_mapping', {})
+                self._keyword_phrases[jurisdiction] = [
+                    (subdomain, tuple(keyword.lower() for keyword in keywords), len(keywords))
+                    for subdomain, keywords in keyword_mapping.items()
+                ]
+                self._keyword_index[jurisdiction] = self._build_keyword_index(keyword_mapping)
+            self.domain_maps[jurisdiction] = domain_map
+        return self.domain_maps[jurisdiction]
+    
+    @staticmethod
+    def _build_keyword_index(keyword_mapping: Dict) -> Dict[str, List[Tuple[str, int]]]:
+        """Map each keyword word to the subdomains using it and how many of their keywords contain it"""
+        index = defaultdict(list)
+        for subdomain, keywords in keyword_mapping.items():
+            word_counts = Counter(word for keyword in keywords for word in set(keyword.lower().split()))
+            for word, count in word_counts.items():
+                index[word].append((subdomain, count))
+        return dict(index)
+    
+    def get_law_dataset(self, jurisdiction: str) -> Optional[Dict]:
+        """Return the law dataset for a jurisdiction, loading it on first use"""
+        if jurisdiction not in self.law_datasets:
+            if jurisdiction not in self.dataset_files:
+                return None
+            dataset = self._load_json(self.dataset_files[jurisdiction], 'Law dataset', jurisdiction)
+            if dataset is not None:
+                self._index_dataset(jurisdiction, dataset)
+            self.law_datasets[jurisdiction] = dataset
+        return self.law_datasets[jurisdiction]
+    
+    def _index_dataset(self, jurisdiction: str, dataset: Dict):
+        """Precompute the query-independent text, word sets and indexes for a loaded dataset"""
+        grouped = jurisdiction in GROUPED_SECTION_JURISDICTIONS
+        self._section_index[jurisdiction] = {
+            table_name: self._build_section_index(dataset[table_name], spec, grouped)
+            for table_name, spec in SECTION_SPECS[jurisdiction].items()
+            if table_name in dataset
+        }
+        
+        it_act_data = dataset.get('special_laws', {}).get('it_act')
+        if it_act_data is not None:
+            it_act_content = ' '.join(
+                it_act_data.get('offences', []) + it_act_data.get('sections', []) + it_act_data.get('process_steps', [])
+            ).lower()
+            # Query terms from TECH_QUERY_MAPPING with at least one legal term
+            # in the IT Act text; which of them a query contains is all that
+            # is left to check per query
+            mapped_query_terms = tuple(
+                query_term for query_term, legal_terms in TECH_QUERY_MAPPING.items()
+                if any(legal_term in it_act_content for legal_term in legal_terms)
+            )
+            self._it_act_index[jurisdiction] = (frozenset(it_act_content.split()), mapped_query_terms)
+    
+    @classmethod
+    def _build_section_index(cls, table: Dict, spec: SectionSpec, grouped: bool) -> Tuple[List[Tuple], Dict[str, List[int]]]:
+        """Tokenize a section table once into entries and a word -> entry positions index
+        
+        Entries are (law_name, key, details, word_count, tech_relevant),
+        law_name being None outside grouped tables, word_count the number of
+        distinct words in the scored text and tech_relevant the entry's
+        _evaluate_relevance verdict for tech queries.
+        """
+        if grouped:
+            rows = [(law_name, key, details) for law_name, articles in table.items() for key, details in articles.items()]
+        else:
+            rows = [(None, key, details) for key, details in table.items()]
+        entries = []
+        postings = defaultdict(list)
+        for position, row in enumerate(rows):
+            _, key, details = row
+            text = ' '.join([f"{key}"] + [f"{details.get(field, '')}" for field in spec.fields])
+            # Interned so query/entry word comparisons usually resolve by identity
+            words = frozenset(map(sys.intern, text.lower().split()))
+            relevance_text = f"{spec.title(*row).lower()} {spec.content(*row).lower()}"
+            entries.append(row + (len(words), cls._evaluate_relevance(relevance_text)))
+            for word in words:
+                postings[word].append(position)
+        return entries, dict(postings)
+    
+    def _candidate_sections(self, jurisdiction: str, table_name: str, query_words: frozenset) -> List[Tuple[Tuple, int, bool]]:
+        """Entries sharing at least one word with the query, in table order
+        
+        Each candidate comes with the number of query words it contains and
+        whether any of those is a tech term, counted from the posting lists
+        so no per-entry intersection set is built.
+        """
+        entries, postings = self._section_index[jurisdiction][table_name]
+        overlaps = Counter()
+        tech_positions = set()
+        for word in query_words:
+            positions = postings.get(word)
+            if positions is None:
+                continue
+            overlaps.update(positions)
+            if word in TECH_TERMS:
+                tech_positions.update(positions)
+        return [(entries[position], overlaps[position], position in tech_positions) for position in sorted(overlaps)]
+    
+    def _score_tables(self, jurisdiction: str, domain: str, query_lower: str, query_words: frozenset,
+                      top_matches: List, order: count):
+        """Score every section table the jurisdiction's dataset has, in SECTION_SPECS order"""
+        specs = SECTION_SPECS[jurisdiction]
+        for table_name in self._section_index[jurisdiction]:
+            spec = specs[table_name]
+            if spec.domains is None or domain in spec.domains:
+                self._score_table(jurisdiction, table_name, spec, query_lower, query_words, top_matches, order)
+    
+    def _score_table(self, jurisdiction: str, table_name: str, spec: SectionSpec, query_lower: str,
+                     query_words: frozenset, top_matches: List, order: count):
+        """Score one section table against the query and push relevant entries into top_matches"""
+        query_has_tech = TECH_QUERY_RE.search(query_lower) is not None
+        # Entry details are only read when a kept result is built at the end
+        query_word_count = len(query_words)
+        for entry, overlap, tech_overlap in self._candidate_sections(jurisdiction, table_name, query_words):
+            law_name, key, details, entry_word_count, tech_relevant = entry
+            
+            # Calculate relevance score
+            relevance_score = overlap / (query_word_count if query_word_count >= entry_word_count else entry_word_count)
+            
+            # Prioritize tech-related matches
+            if tech_overlap:
+                relevance_score *= 2.0  # Boost tech matches
+            
+            if relevance_score > 0.1:  # Minimum relevance threshold
+                # A full heap would evict this entry straight away (ties go to
+                # the earlier match), so skip it
+                if len(top_matches) == MAX_SEARCH_RESULTS and relevance_score <= top_matches[0][0]:
+                    continue
+                
+                # Check semantic relevance (only tech queries filter anything)
+                if tech_relevant or not query_has_tech:
+                    _push_top_match(top_matches, order, relevance_score,
+                                    partial(self._section_result, spec, law_name, key, details, relevance_score))
+    
+    @staticmethod
+    def _section_result(spec: SectionSpec, law_name: Optional[str], key: str, details: Dict, relevance_score: float) -> Dict:
+        """Result dict for a section-table match"""
+        result = spec.result(law_name, key, details)
+        result['confidence'] = min(spec.confidence_cap, relevance_score)
+        result['relevance_score'] = relevance_score
+        return result
+    
+    def detect_jurisdiction(self, query: str, jurisdiction_hint: Optional[str] = None) -> str:
+        """Detect jurisdiction from query or hint"""
+        return _detect_jurisdiction(query, jurisdiction_hint)
+    
+    def classify_domain(self, query: str, jurisdiction: str) -> Tuple[str, str, float]:
+        """Classify query domain and subdomain using domain mapping with improved semantic matching"""
+        return self._classify_domain_cached(query, jurisdiction)
+    
+    def _classify_domain(self, query: str, jurisdiction: str) -> Tuple[str, str, float]:
+        """Uncached implementation behind classify_domain"""
+        domain_map = self.get_domain_map(jurisdiction)
+        if domain_map is None:
+            return 'civil', 'general', 0.5
+        
+        # Count keyword matches for each subdomain with semantic weights
+        domain_scores = defaultdict(float)
+        query_lower, query_words = _tokenize(query)
+        
+        # Word matches come from the keyword index: one lookup per query word
+        # instead of a set intersection per keyword
+        keyword_index = self._keyword_index[jurisdiction]
+        word_matches = defaultdict(int)
+        for word in query_words:
+            for subdomain, count in keyword_index.get(word, ()):
+                word_matches[subdomain] += count
+        
+        # Keywords are lowercased once when the domain map is loaded
+        for subdomain, keywords_lower, keyword_count in self._keyword_phrases[jurisdiction]:
+            # Exact phrase matches get higher weight
+            exact_matches = sum(1 for keyword_lower in keywords_lower if keyword_lower in query_lower)
+            partial_matches = word_matches[subdomain]
+            
+            # Calculate weighted score
+            if exact_matches > 0:
+                # Prioritize exact matches
+                domain_scores[subdomain] = min(1.0, (exact_matches * 2 + partial_matches) / keyword_count)
+            elif partial_matches > 0:
+                domain_scores[subdomain] = min(0.8, partial_matches / keyword_count)
+        
+        # Find best matching subdomain
+        if domain_scores:
+            best_subdomain = max(domain_scores, key=domain_scores.get)
+            confidence = domain_scores[best_subdomain]
+            
+            # Map subdomain to main domain
+            domain_mapping = domain_map.get('domain_mapping', {})
+            for main_domain, config in domain_mapping.items():
+                if best_subdomain in config.get('subdomains', []):
+                    return main_domain, best_subdomain, confidence
+        
+        # Fallback to default
+        fallback = domain_map.get('fallback_rules', {})
+        default_domain = fallback.get('default_domain', 'civil')
+        return default_domain, 'general', 0.3
+    
+    def search_law_data(self, query: str, jurisdiction: str, domain: str, subdomain: str) -> List[Dict]:
+        """Search for relevant legal data in the dataset
+        
+        Repeated searches are served from a per-loader LRU cache. The result
+        dicts are shared between calls and must be treated as read-only.
+        """
+        return list(self._search_law_data_cached(query, jurisdiction, domain, subdomain))
+    
+    def _search_law_data(self, query: str, jurisdiction: str, domain: str, subdomain: str) -> Tuple[Dict, ...]:
+        """Uncached implementation behind search_law_data"""
+        dataset = self.get_law_dataset(jurisdiction)
+        if dataset is None:
+            return ()
+        
+        # Search strategy varies by jurisdiction; the query is lowercased and
+        # split once here and passed down to the search and relevance checks
+        search_fn = self._search_fns.get(jurisdiction)
+        if search_fn is None:
+            return ()
+        query_lower, query_words = _tokenize(query)
+        return tuple(search_fn(query_lower, query_words, dataset, domain, subdomain))
+    
+    @staticmethod
+    def _evaluate_relevance(combined_lower: str) -> bool:
+        """Evaluate if a legal provision stays relevant to tech queries
+        
+        combined_lower is the provision's lowercased title and content joined
+        by a space. Non-tech queries accept every provision, so only this
+        tech-query verdict depends on the provision and it is computed once
+        per entry when the dataset is indexed.
+        """
+        # If query is about technology but result is about personal/family law, it's likely irrelevant
+        if PERSONAL_STATUS_RE.search(combined_lower) is not None:
+            return False
+        
+        # Check if both relate to similar topics
+        return TECH_RESULT_RE.search(combined_lower) is not None
+
+    def _search_indian_law(self, query_lower: str, query_words: frozenset, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
+        """Search Indian law dataset with improved semantic matching"""
+        top_matches = []
+        order = count()
+        
+        # Check for direct fallback matches, overlaying the scores on the
+        # shared provisions instead of copying them
+        direct_matches = [
+            ChainMap({'relevance_score': 0.9, 'confidence': 0.9}, provision)
+            for provision in self._match_fallbacks(self._fallback_tech_matcher, query_lower)
+        ]
         
         # Return direct matches if found (highest priority)
         if direct_matches:
-            for match in direct_matches[:3]:  # Top 3 matches
-                results.append(match)
-            return results
+            return direct_matches
         
         # Search for IT Act sections if tech-related query
-        if any(term in query_words for term in tech_terms):
+        if not TECH_TERMS.isdisjoint(query_words):
             if 'special_laws' in dataset and 'it_act' in dataset['special_laws']:
-                it_act_data = dataset['special_laws']['it_act']
-                sections = it_act_data.get('sections', [])
-                offences = it_act_data.get('offences', [])
-                process_steps = it_act_data.get('process_steps', [])
-                
-                # Calculate relevance based on tech terms in IT Act data
-                it_act_content = ' '.join(offences + sections + process_steps).lower()
-                it_act_words = set(it_act_content.split())
+                # Calculate relevance based on tech terms in IT Act data (the
+                # word set and mapped query terms are built at load time)
+                it_act_words, mapped_query_terms = self._it_act_index['IN']
                 
                 # Enhanced matching for tech queries
-                tech_query_matches = 0
-                for query_term, legal_terms in tech_query_mapping.items():
-                    if query_term in query_lower:
-                        for legal_term in legal_terms:
-                            if legal_term in it_act_content:
-                                tech_query_matches += 1
-                                break
+                tech_query_matches = sum(1 for query_term in mapped_query_terms if query_term in query_lower)
                 
-                # Regular word matching
-                common_words = query_words.intersection(it_act_words)
-                relevance_score = (len(common_words) + tech_query_matches) / max(len(query_words), len(it_act_words))
+                # Regular word matching; only the count is needed, so iterate
+                # the (small) query side instead of building a set
+                common_words = sum(1 for word in query_words if word in it_act_words)
+                relevance_score = (common_words + tech_query_matches) / max(len(query_words), len(it_act_words))
                 
                 if relevance_score > 0.05:  # Lower threshold since it's general law area
-                    results.append({
-                        'type': 'it_act_section',
-                        'section': ', '.join(sections),
-                        'title': 'Information Technology Act, 2000 - Cyber Crimes',
-                        'description': f"Relevant offences: {', '.join(offences)}",
-                        'penalties': 'Varies by section - Refer to IT Act 2000',
-                        'process': process_steps,
-                        'confidence': min(0.85, relevance_score * 2),  # Adjust confidence
-                        'relevance_score': relevance_score
-                    })
-        
-        # Search BNS sections (criminal law)
-        if 'bns_sections' in dataset:
-            for offence, details in dataset['bns_sections'].items():
-                # Calculate relevance score based on semantic similarity
-                offence_lower = f"{offence} {details.get('offence', '')}".lower()
-                offence_words = set(offence_lower.split())
-                
-                # Calculate overlap
-                common_words = query_words.intersection(offence_words)
-                tech_overlap = tech_terms.intersection(common_words)
-                
-                # Calculate relevance score
-                relevance_score = len(common_words) / max(len(query_words), len(offence_words))
-                
-                # Prioritize tech-related matches
-                if tech_overlap:
-                    relevance_score *= 2.0  # Boost tech matches
-                
-                # Evaluate semantic relevance
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    # Check semantic relevance
-                    legal_title = f"{offence} {details.get('offence', '')}"
-                    legal_content = f"{details.get('punishment', '')} {details.get('elements_required', [])} {details.get('process_steps', [])}"
-                    if self._evaluate_relevance(query, legal_title, legal_content):
-                        results.append({
-                            'type': 'bns_section',
-                            'offence': offence,
-                            'section': details.get('section', ''),
-                            'punishment': details.get('punishment', ''),
-                            'elements': details.get('elements_required', []),
-                            'process': details.get('process_steps', []),
-                            'confidence': min(0.95, relevance_score),
+                    def it_act_result():
+                        it_act_data = dataset['special_laws']['it_act']
+                        sections = it_act_data.get('sections', [])
+                        offences = it_act_data.get('offences', [])
+                        process_steps = it_act_data.get('process_steps', [])
+                        return {
+                            'type': 'it_act_section',
+                            'section': ', '.join(sections),
+                            'title': 'Information Technology Act, 2000 - Cyber Crimes',
+                            'description': f"Relevant offences: {', '.join(offences)}",
+                            'penalties': 'Varies by section - Refer to IT Act 2000',
+                            'process': process_steps,
+                            'confidence': min(0.85, relevance_score * 2),  # Adjust confidence
                             'relevance_score': relevance_score
-                        })
+                        }
+                    _push_top_match(top_matches, order, relevance_score, it_act_result)
         
-        # Search IPC sections
-        if 'ipc_sections' in dataset:
-            for section, details in dataset['ipc_sections'].items():
-                # Calculate relevance score based on semantic similarity
-                section_lower = f"{section} {details.get('title', '')} {details.get('description', '')}".lower()
-                section_words = set(section_lower.split())
-                
-                # Calculate overlap
-                common_words = query_words.intersection(section_words)
-                tech_overlap = tech_terms.intersection(common_words)
-                
-                # Calculate relevance score
-                relevance_score = len(common_words) / max(len(query_words), len(section_words))
-                
-                # Prioritize tech-related matches
-                if tech_overlap:
-                    relevance_score *= 2.0  # Boost tech matches
-                
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    # Check semantic relevance
-                    legal_title = f"{section} {details.get('title', '')}"
-                    legal_content = f"{details.get('description', '')} {details.get('punishment', '')}"
-                    if self._evaluate_relevance(query, legal_title, legal_content):
-                        results.append({
-                            'type': 'ipc_section',
-                            'section': section,
-                            'title': details.get('title', ''),
-                            'description': details.get('description', ''),
-                            'punishment': details.get('punishment', ''),
-                            'confidence': min(0.9, relevance_score),
-                            'relevance_score': relevance_score
-                        })
+        # Search BNS sections (criminal law), IPC sections and, for civil
+        # queries, the civil procedure code. Only entries sharing a word with
+        # the query can pass the relevance threshold, so each table is walked
+        # through its inverted index candidates
+        self._score_tables('IN', domain, query_lower, query_words, top_matches, order)
         
-        # Search civil procedure code
-        if 'cpc_sections' in dataset and domain == 'civil':
-            for section, details in dataset['cpc_sections'].items():
-                # Calculate relevance score based on semantic similarity
-                section_lower = f"{section} {details.get('title', '')}".lower()
-                section_words = set(section_lower.split())
-                
-                # Calculate overlap
-                common_words = query_words.intersection(section_words)
-                tech_overlap = tech_terms.intersection(common_words)
-                
-                # Calculate relevance score
-                relevance_score = len(common_words) / max(len(query_words), len(section_words))
-                
-                # Prioritize tech-related matches
-                if tech_overlap:
-                    relevance_score *= 2.0  # Boost tech matches
-                
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    # Check semantic relevance
-                    legal_title = f"{section} {details.get('title', '')}"
-                    legal_content = f"{details.get('procedure', '')}"
-                    if self._evaluate_relevance(query, legal_title, legal_content):
-                        results.append({
-                            'type': 'cpc_section',
-                            'section': section,
-                            'title': details.get('title', ''),
-                            'procedure': details.get('procedure', ''),
-                            'confidence': min(0.8, relevance_score),
-                            'relevance_score': relevance_score
-                        })
-        
-        # Sort by relevance and return top results
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return results[:3]  # Return top 3 matches
+        # Return top 3 matches by relevance
+        return _ranked_matches(top_matches)
     
-    def _search_uae_law(self, query: str, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
+    def _search_uae_law(self, query_lower: str, query_words: frozenset, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
         """Search UAE law dataset with improved semantic matching"""
-        results = []
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
+        top_matches = []
+        order = count()
         
         # Check for direct fallback matches for UAE
-        uae_fallbacks = self.fallback_provisions.get('UAE', {})
-        direct_matches = []
-        
-        for pattern, provision in uae_fallbacks.items():
-            if pattern in query_lower or any(term in query_lower for term in pattern.split()):
-                matched_provision = provision.copy()
-                matched_provision['relevance_score'] = 0.9
-                matched_provision['confidence'] = 0.9
-                direct_matches.append(matched_provision)
+        direct_matches = [
+            ChainMap({'relevance_score': 0.9, 'confidence': 0.9}, provision)
+            for provision in self._match_fallbacks(self._fallback_uae_matcher, query_lower)
+        ]
         
         if direct_matches:
-            for match in direct_matches[:3]:  # Top 3 matches
-                results.append(match)
-            return results
-        
-        # Look for technology-related terms
-        tech_terms = {'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access', 
-                     'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
-                     'smartphone', 'tablet', 'laptop', 'internet', 'network', 'wifi', 'bluetooth',
-                     'malware', 'virus', 'trojan', 'spyware', 'phishing', 'identity theft',
-                     'online', 'e-commerce', 'digital signature', 'encryption'}
+            return direct_matches
         
-        # Search civil law articles
-        if 'civil_law' in dataset:
-            for law_name, articles in dataset['civil_law'].items():
-                for article_id, details in articles.items():
-                    # Calculate relevance score based on semantic similarity
-                    article_lower = f"{article_id} {details.get('offence', '')} {details.get('title', '')} {details.get('description', '')}".lower()
-                    article_words = set(article_lower.split())
-                    
-                    # Calculate overlap
-                    common_words = query_words.intersection(article_words)
-                    tech_overlap = tech_terms.intersection(common_words)
-                    
-                    # Calculate relevance score
-                    relevance_score = len(common_words) / max(len(query_words), len(article_words))
-                    
-                    # Prioritize tech-related matches
-                    if tech_overlap:
-                        relevance_score *= 2.0  # Boost tech matches
-                    
-                    if relevance_score > 0.1:  # Minimum relevance threshold
-                        # Check semantic relevance
-                        legal_title = f"{law_name} {article_id} {details.get('offence', '')}"
-                        legal_content = f"{details.get('remedies', [])} {details.get('process_steps', [])} {details.get('description', '')}"
-                        if self._evaluate_relevance(query, legal_title, legal_content):
-                            results.append({
-                                'type': 'civil_law',
-                                'law': law_name,
-                                'article': article_id,
-                                'offence': details.get('offence', ''),
-                                'remedies': details.get('civil_remedies', []),
-                                'process': details.get('process_steps', []),
-                                'confidence': min(0.9, relevance_score),
-                                'relevance_score': relevance_score
-                            })
+        # Search civil law articles, then criminal law
+        self._score_tables('UAE', domain, query_lower, query_words, top_matches, order)
         
-        # Search criminal law
-        if 'criminal_law' in dataset:
-            for law_name, sections in dataset['criminal_law'].items():
-                for section_id, details in sections.items():
-                    # Calculate relevance score based on semantic similarity
-                    section_lower = f"{section_id} {details.get('offence', '')} {details.get('title', '')} {details.get('description', '')}".lower()
-                    section_words = set(section_lower.split())
-                    
-                    # Calculate overlap
-                    common_words = query_words.intersection(section_words)
-                    tech_overlap = tech_terms.intersection(common_words)
-                    
-                    # Calculate relevance score
-                    relevance_score = len(common_words) / max(len(query_words), len(section_words))
-                    
-                    # Prioritize tech-related matches
-                    if tech_overlap:
-                        relevance_score *= 2.0  # Boost tech matches
-                    
-                    if relevance_score > 0.1:  # Minimum relevance threshold
-                        # Check semantic relevance
-                        legal_title = f"{law_name} {section_id} {details.get('offence', '')}"
-                        legal_content = f"{details.get('punishment', '')} {details.get('description', '')}"
-                        if self._evaluate_relevance(query, legal_title, legal_content):
-                            results.append({
-                                'type': 'criminal_law',
-                                'law': law_name,
-                                'section': section_id,
-                                'offence': details.get('offence', ''),
-                                'punishment': details.get('punishment', ''),
-                                'confidence': min(0.95, relevance_score),
-                                'relevance_score': relevance_score
-                            })
-        
-        # Sort by relevance and return top results
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return results[:3]
+        # Return top results by relevance
+        return _ranked_matches(top_matches)
     
-    def _search_uk_law(self, query: str, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
+    def _search_uk_law(self, query_lower: str, query_words: frozenset, dataset: Dict, domain: str, subdomain: str) -> List[Dict]:
         """Search UK law dataset with improved semantic matching"""
-        results = []
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        
-        # Look for technology-related terms
-        tech_terms = {'computer', 'digital', 'electronic', 'phone', 'mobile', 'device', 'access', 
-                     'unauthorized', 'cyber', 'hacking', 'data', 'privacy', 'telecommunication',
-                     'smartphone', 'tablet', 'laptop', 'internet', 'network', 'wifi', 'bluetooth',
-                     'malware', 'virus', 'trojan', 'spyware', 'phishing', 'identity theft',
-                     'online', 'e-commerce', 'digital signature', 'encryption'}
-        
-        # Search criminal law
-        if 'criminal_law' in dataset:
-            for section, details in dataset['criminal_law'].items():
-                # Calculate relevance score based on semantic similarity
-                section_lower = f"{section} {details.get('offence', '')} {details.get('title', '')} {details.get('description', '')}".lower()
-                section_words = set(section_lower.split())
-                
-                # Calculate overlap
-                common_words = query_words.intersection(section_words)
-                tech_overlap = tech_terms.intersection(common_words)
-                
-                # Calculate relevance score
-                relevance_score = len(common_words) / max(len(query_words), len(section_words))
-                
-                # Prioritize tech-related matches
-                if tech_overlap:
-                    relevance_score *= 2.0  # Boost tech matches
-                
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    # Check semantic relevance
-                    legal_title = f"{section} {details.get('offence', '')} {details.get('title', '')}"
-                    legal_content = f"{details.get('description', '')} {details.get('punishment', '')}"
-                    if self._evaluate_relevance(query, legal_title, legal_content):
-                        results.append({
-                            'type': 'criminal_law',
-                            'section': section,
-                            'offence': details.get('offence', ''),
-                            'punishment': details.get('punishment', ''),
-                            'confidence': min(0.95, relevance_score),
-                            'relevance_score': relevance_score
-                        })
+        top_matches = []
+        order = count()
         
-        # Search civil law
-        if 'civil_law' in dataset:
-            for section, details in dataset['civil_law'].items():
-                # Calculate relevance score based on semantic similarity
-                section_lower = f"{section} {details.get('title', '')} {details.get('description', '')}".lower()
-                section_words = set(section_lower.split())
-                
-                # Calculate overlap
-                common_words = query_words.intersection(section_words)
-                tech_overlap = tech_terms.intersection(common_words)
-                
-                # Calculate relevance score
-                relevance_score = len(common_words) / max(len(query_words), len(section_words))
-                
-                # Prioritize tech-related matches
-                if tech_overlap:
-                    relevance_score *= 2.0  # Boost tech matches
-                
-                if relevance_score > 0.1:  # Minimum relevance threshold
-                    # Check semantic relevance
-                    legal_title = f"{section} {details.get('title', '')}"
-                    legal_content = f"{details.get('description', '')} {details.get('procedure', '')}"
-                    if self._evaluate_relevance(query, legal_title, legal_content):
-                        results.append({
-                            'type': 'civil_law',
-                            'section': section,
-                            'title': details.get('title', ''),
-                            'procedure': details.get('procedure', ''),
-                            'confidence': min(0.9, relevance_score),
-                            'relevance_score': relevance_score
-                        })
+        # Search criminal law, then civil law
+        self._score_tables('UK', domain, query_lower, query_words, top_matches, order)
         
-        # Sort by relevance and return top results
-        results.sort(key=lambda x: x['relevance_score'], reverse=True)
-        return results[:3]
+        # Return top results by relevance
+        return _ranked_matches(top_matches)
     
     def format_response(self, query: str, jurisdiction: str, domain: str, subdomain: str, 
                        legal_data: List[Dict], confidence: float) -> Dict:
@@ -848,96 +1005,12 @@ class LegalDataLoader:
         all_citations = []
         
         for item in legal_data:
-            section_data = {}
-            
-            if item['type'] == 'bns_section':
-                section_data = {
-                    "title": f"BNS Section {item['section']} - {item['offence']}",
-                    "definition": item.get('definition', 'Refer to Bharatiya Nyaya Sanhita for complete definition'),
-                    "content": f"Punishment: {item['punishment']}",
-                    "elements": item.get('elements', []),
-                    "process": item.get('process', []),
-                    "penalties": {
-                        "imprisonment": item['punishment'],
-                        "fine": "As determined by court"
-                    }
-                }
-                all_citations.append(f"Bharatiya Nyaya Sanhita Section {item['section']}")
-                
-            elif item['type'] == 'ipc_section':
-                section_data = {
-                    "title": f"IPC {item['section']} - {item['title']}",
-                    "definition": item.get('definition', 'Refer to Indian Penal Code for complete definition'),
-                    "content": item.get('description', ''),
-                    "elements": item.get('elements_required', []),
-                    "process": item.get('process_steps', []),
-                    "penalties": {
-                        "imprisonment": item.get('punishment', 'Refer to IPC section for details'),
-                        "fine": "As determined by court"
-                    }
-                }
-                all_citations.append(f"Indian Penal Code Section {item['section']}")
-                
-            elif item['type'] == 'cpc_section':
-                section_data = {
-                    "title": f"CPC {item['section']} - {item['title']}",
-                    "definition": "Civil procedure provision",
-                    "procedure": item.get('procedure', []),
-                    "process": item.get('process_steps', [])
-                }
-                all_citations.append(f"Civil Procedure Code Section {item['section']}")
-                
-            elif item['type'] == 'it_act_section':
-                section_data = {
-                    "title": f"IT Act {item['section']} - {item['title']}",
-                    "definition": item.get('definition', 'Refer to Information Technology Act for complete definition'),
-                    "content": item.get('description', ''),
-                    "elements": item.get('elements', []),
-                    "process": item.get('process', []),
-                    "penalties": item.get('penalties', {
-                        "compensation": "As per IT Act provisions",
-                        "imprisonment": "As per IT Act provisions",
-                        "fine": "As determined by court"
-                    }),
-                    "citations": item.get('citations', [
-                        f"Information Technology Act, 2000, {item['section']}"
-                    ])
-                }
-                # Add specific citations if provided
-                if 'citations' in item:
-                    all_citations.extend(item['citations'])
-                else:
-                    all_citations.append(f"Information Technology Act Section {item['section']}")
-                
-            elif item['type'] == 'civil_law':
-                section_data = {
-                    "title": f"{item['law']} - {item['article']}",
-                    "definition": "Civil law provision",
-                    "content": item.get('offence', ''),
-                    "remedies": item.get('remedies', []),
-                    "process": item.get('process', []),
-                    "elements": item.get('elements_required', [])
-                }
-                all_citations.append(f"{item['law']} {item['article']}")
-            
-            elif item['type'] == 'criminal_law':
-                section_data = {
-                    "title": f"{item['law']} - {item['title']}",
-                    "definition": item.get('definition', 'Refer to criminal code for complete definition'),
-                    "content": item.get('offence', ''),
-                    "elements": item.get('elements', []),
-                    "process": item.get('process', []),
-                    "penalties": item.get('punishment', {
-                        "imprisonment": "As prescribed by law",
-                        "fine": "As determined by court"
-                    }),
-                    "citations": item.get('citations', [])
-                }
-                # Add specific citations if provided
-                if 'citations' in item:
-                    all_citations.extend(item['citations'])
-                else:
-                    all_citations.append(f"{item['law']} - {item['title']}")
+            formatter = RESULT_FORMATTERS.get(item['type'])
+            if formatter is not None:
+                section_data, citations = formatter(item)
+                all_citations.extend(citations)
+            else:
+                section_data = {}
             
             # Add common fields
             section_data["type"] = item['type']